@@ -25,38 +25,74 @@ Quick Start::
 
 from __future__ import annotations
 
-from botanu._version import __version__
+import importlib
+from typing import TYPE_CHECKING, Any, Dict
 
-# Run context model
+# Run context model — small and dependency-free, so imported eagerly.
 from botanu.models.run_context import RunContext, RunOutcome, RunStatus
 
-# Processors
-from botanu.processors import RunContextEnricher, SampledSpanProcessor
+if TYPE_CHECKING:
+    from botanu._version import __version__
+    from botanu.processors import RunContextEnricher, SampledSpanProcessor
+    from botanu.sdk.bootstrap import disable, enable, is_enabled
+    from botanu.sdk.config import BotanuConfig
+    from botanu.sdk.context import (
+        baggage_scope,
+        get_baggage,
+        get_baggage_bulk,
+        get_current_span,
+        get_run_id,
+        get_workflow,
+        set_baggage,
+    )
+    from botanu.sdk.decorators import event, step
+    from botanu.sdk.span_helpers import emit_outcome, set_business_context, set_correlation
+
+# Everything else is resolved on first attribute access (PEP 562) so that
+# ``import botanu`` does not pull in the OTel SDK, exporters and bootstrap
+# machinery until they are actually used.
+_LAZY_EXPORTS: Dict[str, str] = {
+    # Package metadata lookup is deferred too (see botanu._version)
+    "__version__": "botanu._version",
+    # Processors
+    "RunContextEnricher": "botanu.processors",
+    "SampledSpanProcessor": "botanu.processors",
+    # Bootstrap
+    "enable": "botanu.sdk.bootstrap",
+    "disable": "botanu.sdk.bootstrap",
+    "is_enabled": "botanu.sdk.bootstrap",
+    # Configuration
+    "BotanuConfig": "botanu.sdk.config",
+    # Context helpers
+    "baggage_scope": "botanu.sdk.context",
+    "get_baggage": "botanu.sdk.context",
+    "get_baggage_bulk": "botanu.sdk.context",
+    "get_current_span": "botanu.sdk.context",
+    "get_run_id": "botanu.sdk.context",
+    "get_workflow": "botanu.sdk.context",
+    "set_baggage": "botanu.sdk.context",
+    # Primary integration API
+    "event": "botanu.sdk.decorators",
+    "step": "botanu.sdk.decorators",
+    # Span helpers
+    "emit_outcome": "botanu.sdk.span_helpers",
+    "set_business_context": "botanu.sdk.span_helpers",
+    "set_correlation": "botanu.sdk.span_helpers",
+}
 
-# Bootstrap
-from botanu.sdk.bootstrap import (
-    disable,
-    enable,
-    is_enabled,
-)
 
-# Configuration
-from botanu.sdk.config import BotanuConfig
+def __getattr__(name: str) -> Any:
+    module_path = _LAZY_EXPORTS.get(name)
+    if module_path is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_path), name)
+    globals()[name] = value  # cache so later lookups skip __getattr__
+    return value
 
-# Context helpers  (core — no SDK dependency)
-from botanu.sdk.context import (
-    get_baggage,
-    get_current_span,
-    get_run_id,
-    get_workflow,
-    set_baggage,
-)
 
-# Primary integration API
-from botanu.sdk.decorators import event, step
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
 
-# Span helpers
-from botanu.sdk.span_helpers import emit_outcome, set_business_context, set_correlation
 
 __all__ = [
     "__version__",
@@ -78,7 +114,9 @@ __all__ = [
     "get_run_id",
     "get_workflow",
     "set_baggage",
+    "baggage_scope",
     "get_baggage",
+    "get_baggage_bulk",
     # Run context
     "RunContext",
     "RunStatus",
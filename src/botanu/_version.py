@@ -1,13 +1,30 @@
 # SPDX-FileCopyrightText: 2026 The Botanu Authors
 # SPDX-License-Identifier: Apache-2.0
 
-"""Dynamic version from package metadata (set by hatch-vcs at build time)."""
+"""Dynamic version from package metadata (set by hatch-vcs at build time).
+
+Resolved on first access (PEP 562): ``importlib.metadata`` scans every
+``sys.path`` entry and parses ``METADATA``, which is noticeable on cold
+starts and unnecessary for processes that never read the version.
+"""
 
 from __future__ import annotations
 
-try:
-    from importlib.metadata import version
+from typing import Any
+
+
+def _compute_version() -> str:
+    try:
+        from importlib.metadata import version
+
+        return version("botanu")
+    except Exception:
+        return "0.0.0.dev0"
+
 
-    __version__: str = version("botanu")
-except Exception:
-    __version__ = "0.0.0.dev0"
+def __getattr__(name: str) -> Any:
+    if name == "__version__":
+        global __version__
+        __version__ = _compute_version()
+        return __version__
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
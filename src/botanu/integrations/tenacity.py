@@ -36,7 +36,9 @@ from __future__ import annotations
 
 from typing import Any
 
-from botanu.tracking.llm import _retry_attempt
+from botanu.tracking.llm import _RETRY_NOT_ACTIVE, _retry_attempt
+
+__all__ = ["botanu_after_all", "botanu_before"]
 
 
 def botanu_before(retry_state: Any) -> None:
@@ -55,6 +57,9 @@ def botanu_after_all(retry_state: Any) -> None:
     Optional but recommended. Prevents a stale attempt number from
     leaking into subsequent non-retried calls on the same thread.
 
+    Resets to the "no retry in flight" sentinel, so ``track_llm_call``
+    stops stamping ``botanu.request.attempt`` on later spans.
+
     Use as ``@retry(after=botanu_after_all)``.
     """
-    _retry_attempt.set(0)
+    _retry_attempt.set(_RETRY_NOT_ACTIVE)
@@ -20,12 +20,20 @@ In-process PII scrubbing of content-capture attributes is handled by
 from __future__ import annotations
 
 import logging
+import sys
 from typing import ClassVar, List, Optional
 
 from opentelemetry import baggage, context
 from opentelemetry.sdk.trace import ReadableSpan, SpanProcessor
 from opentelemetry.trace import Span
 
+try:
+    # Private, but stable since the baggage API was introduced. Reading the
+    # Context entry directly skips get_all()'s MappingProxyType wrapper.
+    from opentelemetry.baggage import _BAGGAGE_KEY
+except ImportError:  # pragma: no cover - fall back to the public API
+    _BAGGAGE_KEY = None  # type: ignore[assignment]
+
 logger = logging.getLogger(__name__)
 
 
@@ -43,14 +51,16 @@ class RunContextEnricher(SpanProcessor):
     would not.
     """
 
+    # Interned to match the keys RunContext writes into baggage, so the
+    # per-span lookups below compare by identity.
     BAGGAGE_KEYS: ClassVar[List[str]] = [
-        "botanu.run_id",
-        "botanu.workflow",
-        "botanu.event_id",
-        "botanu.customer_id",
-        "botanu.environment",
-        "botanu.tenant_id",
-        "botanu.parent_run_id",
+        sys.intern("botanu.run_id"),
+        sys.intern("botanu.workflow"),
+        sys.intern("botanu.event_id"),
+        sys.intern("botanu.customer_id"),
+        sys.intern("botanu.environment"),
+        sys.intern("botanu.tenant_id"),
+        sys.intern("botanu.parent_run_id"),
     ]
 
     def on_start(
@@ -59,13 +69,26 @@ class RunContextEnricher(SpanProcessor):
         parent_context: Optional[context.Context] = None,
     ) -> None:
         """Called when a span starts — enrich with run context from baggage."""
+        if not span.is_recording():
+            # Sampled-out spans drop their attributes; skip the baggage work.
+            return
         ctx = parent_context or context.get_current()
 
+        # One baggage read per span, then plain dict lookups per key —
+        # get_baggage(key) would re-resolve the baggage mapping every time.
+        if _BAGGAGE_KEY is not None:
+            entries = ctx.get(_BAGGAGE_KEY)
+        else:
+            entries = baggage.get_all(ctx)
+        if not entries:
+            # Spans outside any botanu scope: nothing to stamp.
+            return
+        existing = span.attributes
+        set_attribute = span.set_attribute
         for key in self.BAGGAGE_KEYS:
-            value = baggage.get_baggage(key, ctx)
-            if value:
-                if not span.attributes or key not in span.attributes:
-                    span.set_attribute(key, value)
+            value = entries.get(key)
+            if value and (not existing or key not in existing):
+                set_attribute(key, value)
 
     def on_end(self, span: ReadableSpan) -> None:
         pass
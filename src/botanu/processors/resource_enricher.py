@@ -29,7 +29,7 @@ dict).
 from __future__ import annotations
 
 import logging
-from typing import Mapping, Optional
+from typing import FrozenSet, Mapping, Optional, Tuple
 
 from opentelemetry import context
 from opentelemetry.sdk.trace import ReadableSpan, Span, SpanProcessor
@@ -67,6 +67,21 @@ _SYSTEM_TO_CLOUD_PROVIDER: dict[str, str] = {
     "synapse": "azure",
 }
 
+# Attribute-key indicators. Probed with frozenset.isdisjoint(), which
+# walks the span's keys once — far cheaper than `key in attrs` on the
+# SDK's BoundedAttributes, where every miss raises and catches a KeyError.
+_LLM_ATTR_KEYS = frozenset({"gen_ai.request.model", "gen_ai.system", "llm.request.model"})
+_AWS_ATTR_KEYS = frozenset({"aws.service", "aws.region"})
+_GCP_ATTR_KEYS = frozenset({"gcp.service", "gcp.project_id"})
+_AZURE_ATTR_KEYS = frozenset({"azure.resource", "azure.namespace"})
+
+# Checked in order; first provider whose indicator keys appear wins.
+_PROVIDER_ATTR_KEYS: Tuple[Tuple[str, FrozenSet[str]], ...] = (
+    ("aws", _AWS_ATTR_KEYS),
+    ("gcp", _GCP_ATTR_KEYS),
+    ("azure", _AZURE_ATTR_KEYS),
+)
+
 _BOTANU_CLOUD_PROVIDER = "botanu.cloud_provider"
 _BOTANU_BYTES_TRANSFERRED = "botanu.bytes_transferred"
 
@@ -121,11 +136,7 @@ class ResourceEnricher(SpanProcessor):
 
 
 def _is_llm_span(attrs: Mapping[str, object]) -> bool:
-    return (
-        "gen_ai.request.model" in attrs
-        or "gen_ai.system" in attrs
-        or "llm.request.model" in attrs
-    )
+    return not _LLM_ATTR_KEYS.isdisjoint(attrs)
 
 
 def _infer_cloud_provider(attrs: Mapping[str, object]) -> Optional[str]:
@@ -135,12 +146,14 @@ def _infer_cloud_provider(attrs: Mapping[str, object]) -> Optional[str]:
         return explicit.lower()
 
     # 2. AWS auto-instrumentation sets `aws.service` or `rpc.system="aws-api"`
-    if attrs.get("rpc.system") == "aws-api" or "aws.service" in attrs or "aws.region" in attrs:
+    if attrs.get("rpc.system") == "aws-api":
         return "aws"
-    if "gcp.service" in attrs or "gcp.project_id" in attrs:
-        return "gcp"
-    if "azure.resource" in attrs or "azure.namespace" in attrs:
-        return "azure"
+    # Materialize the span's keys once; each provider probe is then a
+    # set-vs-set isdisjoint() instead of another walk over the attributes.
+    keys = set(attrs)
+    for provider, indicator_keys in _PROVIDER_ATTR_KEYS:
+        if not indicator_keys.isdisjoint(keys):
+            return provider
 
     # 3. Infer from system name (db.system, messaging.system, botanu.storage.system)
     for key in ("db.system", "messaging.system", "botanu.storage.system"):
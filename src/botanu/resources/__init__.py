@@ -18,9 +18,12 @@ Install detectors for your environment::
 
 from __future__ import annotations
 
+import functools
 import importlib
 import logging
-from typing import Any, Dict, List, Tuple
+import os
+from types import MappingProxyType
+from typing import Any, Dict, FrozenSet, List, Mapping, Tuple
 
 logger = logging.getLogger(__name__)
 
@@ -44,14 +47,45 @@ _DETECTOR_REGISTRY: List[Tuple[str, str]] = [
 ]
 
 
+# Detectors that query a link-local instance metadata endpoint. Off-cloud
+# (local dev, CI) each one blocks startup until its HTTP timeout expires.
+_METADATA_ENDPOINT_DETECTORS = frozenset(
+    {
+        "AwsEc2ResourceDetector",
+        "GoogleCloudResourceDetector",
+        "AzureVMResourceDetector",
+    }
+)
+
+# Env vars that identify AWS runtimes without EC2 instance metadata
+# (ECS/Fargate tasks, Lambda), where the EC2 IMDS probe can only time out.
+_AWS_NON_EC2_ENV_VARS = ("ECS_CONTAINER_METADATA_URI_V4", "ECS_CONTAINER_METADATA_URI", "AWS_LAMBDA_FUNCTION_NAME")
+
+
+def _skipped_detectors() -> FrozenSet[str]:
+    """Detector class names to leave out, decided once per detection pass."""
+    from botanu.sdk.config import _parse_bool
+
+    if _parse_bool(os.getenv("BOTANU_DISABLE_IMDS"), False):
+        return _METADATA_ENDPOINT_DETECTORS
+    if any(os.getenv(var) for var in _AWS_NON_EC2_ENV_VARS):
+        return frozenset({"AwsEc2ResourceDetector"})
+    return frozenset()
+
+
 def collect_detectors() -> list:
     """Return instances of all importable OTel resource detectors.
 
     Each detector implements ``opentelemetry.sdk.resources.ResourceDetector``.
-    Missing packages are silently skipped.
+    Missing packages are silently skipped, as are the metadata-endpoint
+    detectors when ``BOTANU_DISABLE_IMDS`` is set (and the EC2 one on
+    ECS/Lambda, which have no EC2 instance metadata).
     """
     detectors: list = []
+    skipped = _skipped_detectors()
     for module_path, class_name in _DETECTOR_REGISTRY:
+        if class_name in skipped:
+            continue
         try:
             mod = importlib.import_module(module_path)
             cls = getattr(mod, class_name)
@@ -71,17 +105,39 @@ def detect_resource_attrs() -> Dict[str, Any]:
 
     Returns a flat dict of resource attributes.  This is a convenience
     wrapper for callers that just need a dict (like bootstrap.py).
+
+    Results are cached per process: cloud detectors probe metadata
+    endpoints over the network, and none of what they report changes at
+    runtime.  A forked child (new pid) detects afresh so ``process.*``
+    attributes stay accurate.
     """
+    return dict(_cached_resource_attrs())
+
+
+def _cached_resource_attrs() -> Mapping[str, Any]:
+    """Read-only view of the cached detection result, for internal readers
+    that don't need their own copy."""
+    return _detect_resource_attrs(os.getpid())
+
+
+@functools.lru_cache(maxsize=1)
+def _detect_resource_attrs(pid: int) -> Mapping[str, Any]:
     attrs: Dict[str, Any] = {}
     for detector in collect_detectors():
         try:
             resource = detector.detect()
-            attrs.update(dict(resource.attributes))
+            attrs.update(resource.attributes)
         except Exception:
             # Community detectors may raise on network timeouts, missing
             # metadata endpoints, etc.  Never let detection break SDK init.
             logger.debug("Resource detector %s failed", type(detector).__name__, exc_info=True)
-    return attrs
+    # Shared by every caller via lru_cache, so hand out a read-only view.
+    return MappingProxyType(attrs)
+
+
+def _invalidate_detector_cache() -> None:
+    """Forget cached detection results (for tests)."""
+    _detect_resource_attrs.cache_clear()
 
 
 __all__ = ["collect_detectors", "detect_resource_attrs"]
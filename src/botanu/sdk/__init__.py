@@ -5,29 +5,74 @@
 
 from __future__ import annotations
 
-from botanu.sdk.bootstrap import disable, enable, get_config, is_enabled
-from botanu.sdk.config import BotanuConfig
-from botanu.sdk.context import (
-    get_baggage,
-    get_current_span,
-    get_run_id,
-    get_workflow,
-    set_baggage,
-)
-from botanu.sdk.decorators import event, step
-from botanu.sdk.span_helpers import (
-    emit_outcome,
-    set_business_context,
-    set_correlation,
-)
+import importlib
+from typing import TYPE_CHECKING, Any, Dict
+
+if TYPE_CHECKING:
+    from botanu.sdk.bootstrap import disable, enable, get_config, is_enabled
+    from botanu.sdk.config import BotanuConfig
+    from botanu.sdk.context import (
+        baggage_scope,
+        get_baggage,
+        get_baggage_bulk,
+        get_current_span,
+        get_run_id,
+        get_workflow,
+        set_baggage,
+    )
+    from botanu.sdk.decorators import event, step
+    from botanu.sdk.span_helpers import (
+        emit_outcome,
+        set_business_context,
+        set_correlation,
+    )
+
+# Resolved on first access (PEP 562), as in the top-level package, so that
+# importing one submodule (e.g. ``botanu.sdk.decorators``) doesn't drag in
+# bootstrap, config and every sibling.
+_LAZY_EXPORTS: Dict[str, str] = {
+    "disable": "botanu.sdk.bootstrap",
+    "enable": "botanu.sdk.bootstrap",
+    "get_config": "botanu.sdk.bootstrap",
+    "is_enabled": "botanu.sdk.bootstrap",
+    "BotanuConfig": "botanu.sdk.config",
+    "baggage_scope": "botanu.sdk.context",
+    "get_baggage": "botanu.sdk.context",
+    "get_baggage_bulk": "botanu.sdk.context",
+    "get_current_span": "botanu.sdk.context",
+    "get_run_id": "botanu.sdk.context",
+    "get_workflow": "botanu.sdk.context",
+    "set_baggage": "botanu.sdk.context",
+    "event": "botanu.sdk.decorators",
+    "step": "botanu.sdk.decorators",
+    "emit_outcome": "botanu.sdk.span_helpers",
+    "set_business_context": "botanu.sdk.span_helpers",
+    "set_correlation": "botanu.sdk.span_helpers",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_path = _LAZY_EXPORTS.get(name)
+    if module_path is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_path), name)
+    globals()[name] = value  # cache so later lookups skip __getattr__
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
+
 
 __all__ = [
     "BotanuConfig",
+    "baggage_scope",
     "disable",
     "emit_outcome",
     "enable",
     "event",
     "get_baggage",
+    "get_baggage_bulk",
     "get_config",
     "get_current_span",
     "get_run_id",
@@ -19,10 +19,13 @@ Usage::
 
 from __future__ import annotations
 
+import importlib
+import importlib.util
 import logging
 import os
+import sys
 import threading
-from typing import TYPE_CHECKING, List, Optional
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
 
 if TYPE_CHECKING:
     from botanu.sdk.config import BotanuConfig
@@ -79,6 +82,23 @@ def _extract_sampler_ratio(provider) -> float:
     return _SENTINEL_UNKNOWN_RATIO
 
 
+def _resolve_log_level(name: str) -> int:
+    """Map a level name (case-insensitive) to its number; unknown names give INFO.
+
+    Looks the name up in logging's level table rather than with getattr on
+    the module, which would accept non-level attributes.
+    """
+    if sys.version_info >= (3, 11):
+        levels = logging.getLevelNamesMapping()
+    else:  # pragma: no cover - exercised on 3.9/3.10 only
+        levels = logging._nameToLevel
+    level = levels.get(name.upper())
+    if level is None:
+        logger.warning("Botanu SDK: unknown log_level %r; using INFO", name)
+        return logging.INFO
+    return level
+
+
 def enable(
     service_name: Optional[str] = None,
     otlp_endpoint: Optional[str] = None,
@@ -108,6 +128,12 @@ def enable(
     """
     global _initialized, _initialized_pid, _current_config
 
+    # Lock-free fast path for repeat calls. Both globals are only written
+    # under _lock, and the check is repeated once the lock is held.
+    if _initialized and _initialized_pid == os.getpid():
+        logger.warning("Botanu SDK already initialized")
+        return False
+
     with _lock:
         current_pid = os.getpid()
         if _initialized and _initialized_pid == current_pid:
@@ -129,7 +155,7 @@ def enable(
             _initialized = False
             _current_config = None
 
-        logging.basicConfig(level=getattr(logging, log_level.upper()))
+        logging.basicConfig(level=_resolve_log_level(log_level))
 
         from botanu.sdk.config import BotanuConfig as ConfigClass
 
@@ -149,9 +175,7 @@ def enable(
 
         _current_config = cfg
 
-        traces_endpoint = cfg.otlp_endpoint
-        if traces_endpoint and not traces_endpoint.endswith("/v1/traces"):
-            traces_endpoint = f"{traces_endpoint.rstrip('/')}/v1/traces"
+        traces_endpoint = cfg.traces_endpoint
 
         otel_sampler_env = os.getenv("OTEL_TRACES_SAMPLER")
         if otel_sampler_env and otel_sampler_env != "always_on":
@@ -160,7 +184,7 @@ def enable(
                 otel_sampler_env,
             )
 
-        from botanu.sdk.config import _redact_url_credentials
+        from botanu.sdk.config import _redact_url_credentials, _signal_endpoint
 
         logger.info(
             "Initializing Botanu SDK: service=%s, env=%s, endpoint=%s, content_capture_rate=%s",
@@ -203,26 +227,26 @@ def enable(
         try:
             from botanu._version import __version__
             from botanu.processors import RunContextEnricher
-            from botanu.resources import detect_resource_attrs
+            from botanu.resources import _cached_resource_attrs
+
+            optional_attrs = (
+                ("service.version", cfg.service_version),
+                ("service.namespace", cfg.service_namespace),
+            )
+            detected = _cached_resource_attrs() if cfg.auto_detect_resources else {}
+            if detected:
+                logger.debug("Auto-detected resources: %s", list(detected.keys()))
 
+            # Built in one pass; explicit attrs win over detected ones
+            # (later entries of the merge take precedence).
             resource_attrs = {
+                **detected,
                 "service.name": cfg.service_name,
                 "deployment.environment": cfg.deployment_environment,
                 "telemetry.sdk.name": "botanu",
                 "telemetry.sdk.version": __version__,
+                **{key: value for key, value in optional_attrs if value},
             }
-            if cfg.service_version:
-                resource_attrs["service.version"] = cfg.service_version
-            if cfg.service_namespace:
-                resource_attrs["service.namespace"] = cfg.service_namespace
-
-            if cfg.auto_detect_resources:
-                detected = detect_resource_attrs()
-                for key, value in detected.items():
-                    if key not in resource_attrs:
-                        resource_attrs[key] = value
-                if detected:
-                    logger.debug("Auto-detected resources: %s", list(detected.keys()))
 
             resource = Resource.create(resource_attrs)
 
@@ -230,17 +254,23 @@ def enable(
 
             from botanu.processors import ResourceEnricher, SampledSpanProcessor
 
-            botanu_exporter = OTLPSpanExporter(
-                endpoint=traces_endpoint,
-                headers=cfg.otlp_headers or {},
-            )
-            botanu_batch = BatchSpanProcessor(
-                botanu_exporter,
-                max_export_batch_size=cfg.max_export_batch_size,
-                max_queue_size=cfg.max_queue_size,
-                schedule_delay_millis=cfg.schedule_delay_millis,
-                export_timeout_millis=cfg.export_timeout_millis,
-            )
+            botanu_batch: Optional[BatchSpanProcessor] = None
+            if cfg.traces_enabled:
+                botanu_exporter = OTLPSpanExporter(
+                    endpoint=traces_endpoint,
+                    headers=cfg.otlp_headers or {},
+                )
+                botanu_batch = BatchSpanProcessor(
+                    botanu_exporter,
+                    max_export_batch_size=cfg.max_export_batch_size,
+                    max_queue_size=cfg.max_queue_size,
+                    schedule_delay_millis=cfg.schedule_delay_millis,
+                    export_timeout_millis=cfg.export_timeout_millis,
+                )
+            else:
+                # No exporter means no batch worker thread or span queue;
+                # enrichers still run so in-process readers see botanu attrs.
+                logger.debug("Botanu SDK: trace export disabled; skipping OTLP span exporter")
 
             existing = trace.get_tracer_provider()
 
@@ -300,7 +330,8 @@ def enable(
                 provider.add_span_processor(RunContextEnricher())
                 if cfg.auto_instrument_resources:
                     provider.add_span_processor(ResourceEnricher())
-                provider.add_span_processor(botanu_batch)
+                if botanu_batch is not None:
+                    provider.add_span_processor(botanu_batch)
                 trace.set_tracer_provider(provider)
 
                 if original_ratio == _SENTINEL_UNKNOWN_RATIO:
@@ -325,7 +356,8 @@ def enable(
                 provider.add_span_processor(RunContextEnricher())
                 if cfg.auto_instrument_resources:
                     provider.add_span_processor(ResourceEnricher())
-                provider.add_span_processor(botanu_batch)
+                if botanu_batch is not None:
+                    provider.add_span_processor(botanu_batch)
                 trace.set_tracer_provider(provider)
 
             else:
@@ -343,7 +375,8 @@ def enable(
                 provider.add_span_processor(RunContextEnricher())
                 if cfg.auto_instrument_resources:
                     provider.add_span_processor(ResourceEnricher())
-                provider.add_span_processor(botanu_batch)
+                if botanu_batch is not None:
+                    provider.add_span_processor(botanu_batch)
                 trace.set_tracer_provider(provider)
 
             set_global_textmap(
@@ -364,9 +397,7 @@ def enable(
                 from opentelemetry.sdk._logs import LoggerProvider as _LoggerProvider
                 from opentelemetry.sdk._logs.export import BatchLogRecordProcessor
 
-                logs_endpoint = cfg.otlp_endpoint
-                if logs_endpoint and not logs_endpoint.endswith("/v1/logs"):
-                    logs_endpoint = f"{logs_endpoint.rstrip('/')}/v1/logs"
+                logs_endpoint = _signal_endpoint(cfg.otlp_endpoint, "/v1/logs")
 
                 log_provider = _LoggerProvider(resource=resource)
                 log_exporter = OTLPLogExporter(endpoint=logs_endpoint, headers=cfg.otlp_headers or {})
@@ -399,101 +430,96 @@ def enable(
             return False
 
 
+# (name, instrumented library, instrumentation module, instrumentor class).
+# Each instrumentation is optional; rows whose library or instrumentation
+# package isn't installed are skipped.
+_INSTRUMENTATIONS: Tuple[Tuple[str, str, str, str], ...] = (
+    # ── HTTP clients ──────────────────────────────────────────────
+    ("httpx", "httpx", "opentelemetry.instrumentation.httpx", "HTTPXClientInstrumentor"),
+    ("requests", "requests", "opentelemetry.instrumentation.requests", "RequestsInstrumentor"),
+    ("urllib3", "urllib3", "opentelemetry.instrumentation.urllib3", "URLLib3Instrumentor"),
+    ("urllib", "urllib", "opentelemetry.instrumentation.urllib", "URLLibInstrumentor"),
+    ("aiohttp_client", "aiohttp", "opentelemetry.instrumentation.aiohttp_client", "AioHttpClientInstrumentor"),
+    ("aiohttp_server", "aiohttp", "opentelemetry.instrumentation.aiohttp_server", "AioHttpServerInstrumentor"),
+    # ── Web frameworks ────────────────────────────────────────────
+    ("fastapi", "fastapi", "opentelemetry.instrumentation.fastapi", "FastAPIInstrumentor"),
+    ("flask", "flask", "opentelemetry.instrumentation.flask", "FlaskInstrumentor"),
+    ("django", "django", "opentelemetry.instrumentation.django", "DjangoInstrumentor"),
+    ("starlette", "starlette", "opentelemetry.instrumentation.starlette", "StarletteInstrumentor"),
+    ("falcon", "falcon", "opentelemetry.instrumentation.falcon", "FalconInstrumentor"),
+    ("pyramid", "pyramid", "opentelemetry.instrumentation.pyramid", "PyramidInstrumentor"),
+    ("tornado", "tornado", "opentelemetry.instrumentation.tornado", "TornadoInstrumentor"),
+    # ── Databases ─────────────────────────────────────────────────
+    ("sqlalchemy", "sqlalchemy", "opentelemetry.instrumentation.sqlalchemy", "SQLAlchemyInstrumentor"),
+    ("psycopg2", "psycopg2", "opentelemetry.instrumentation.psycopg2", "Psycopg2Instrumentor"),
+    ("psycopg", "psycopg", "opentelemetry.instrumentation.psycopg", "PsycopgInstrumentor"),
+    ("asyncpg", "asyncpg", "opentelemetry.instrumentation.asyncpg", "AsyncPGInstrumentor"),
+    ("aiopg", "aiopg", "opentelemetry.instrumentation.aiopg", "AiopgInstrumentor"),
+    ("pymongo", "pymongo", "opentelemetry.instrumentation.pymongo", "PymongoInstrumentor"),
+    ("redis", "redis", "opentelemetry.instrumentation.redis", "RedisInstrumentor"),
+    ("mysql", "mysql.connector", "opentelemetry.instrumentation.mysql", "MySQLInstrumentor"),
+    ("mysqlclient", "MySQLdb", "opentelemetry.instrumentation.mysqlclient", "MySQLClientInstrumentor"),
+    ("pymysql", "pymysql", "opentelemetry.instrumentation.pymysql", "PyMySQLInstrumentor"),
+    ("sqlite3", "sqlite3", "opentelemetry.instrumentation.sqlite3", "SQLite3Instrumentor"),
+    ("elasticsearch", "elasticsearch", "opentelemetry.instrumentation.elasticsearch", "ElasticsearchInstrumentor"),
+    ("cassandra", "cassandra", "opentelemetry.instrumentation.cassandra", "CassandraInstrumentor"),
+    ("tortoise_orm", "tortoise", "opentelemetry.instrumentation.tortoiseorm", "TortoiseORMInstrumentor"),
+    # ── Caching ───────────────────────────────────────────────────
+    ("pymemcache", "pymemcache", "opentelemetry.instrumentation.pymemcache", "PymemcacheInstrumentor"),
+    # ── Messaging / Task queues ───────────────────────────────────
+    ("celery", "celery", "opentelemetry.instrumentation.celery", "CeleryInstrumentor"),
+    ("kafka-python", "kafka", "opentelemetry.instrumentation.kafka_python", "KafkaInstrumentor"),
+    ("confluent-kafka", "confluent_kafka", "opentelemetry.instrumentation.confluent_kafka", "ConfluentKafkaInstrumentor"),
+    ("aiokafka", "aiokafka", "opentelemetry.instrumentation.aiokafka", "AioKafkaInstrumentor"),
+    ("pika", "pika", "opentelemetry.instrumentation.pika", "PikaInstrumentor"),
+    ("aio-pika", "aio_pika", "opentelemetry.instrumentation.aio_pika", "AioPikaInstrumentor"),
+    # ── AWS ───────────────────────────────────────────────────────
+    ("botocore", "botocore", "opentelemetry.instrumentation.botocore", "BotocoreInstrumentor"),
+    ("boto3sqs", "boto3", "opentelemetry.instrumentation.boto3sqs", "Boto3SQSInstrumentor"),
+    # ── gRPC ──────────────────────────────────────────────────────
+    ("grpc_client", "grpc", "opentelemetry.instrumentation.grpc", "GrpcInstrumentorClient"),
+    ("grpc_server", "grpc", "opentelemetry.instrumentation.grpc", "GrpcInstrumentorServer"),
+    # ── GenAI / AI ────────────────────────────────────────────────
+    ("openai", "openai", "opentelemetry.instrumentation.openai_v2", "OpenAIInstrumentor"),
+    ("anthropic", "anthropic", "opentelemetry.instrumentation.anthropic", "AnthropicInstrumentor"),
+    ("vertexai", "vertexai", "opentelemetry.instrumentation.vertexai", "VertexAIInstrumentor"),
+    ("google_genai", "google.generativeai", "opentelemetry.instrumentation.google_generativeai", "GoogleGenerativeAIInstrumentor"),
+    ("langchain", "langchain_core", "opentelemetry.instrumentation.langchain", "LangchainInstrumentor"),
+    ("ollama", "ollama", "opentelemetry.instrumentation.ollama", "OllamaInstrumentor"),
+    ("crewai", "crewai", "opentelemetry.instrumentation.crewai", "CrewAIInstrumentor"),
+    # ── Runtime / Concurrency ─────────────────────────────────────
+    ("logging", "logging", "opentelemetry.instrumentation.logging", "LoggingInstrumentor"),
+    ("threading", "threading", "opentelemetry.instrumentation.threading", "ThreadingInstrumentor"),
+    ("asyncio", "asyncio", "opentelemetry.instrumentation.asyncio", "AsyncioInstrumentor"),
+)
+
+
+# Instrumentor classes resolved by _try_instrument, keyed by
+# (module, class), so repeat enable() cycles skip the import machinery.
+_INSTRUMENTOR_CACHE: Dict[Tuple[str, str], type] = {}
+
+
 def _enable_auto_instrumentation() -> None:
     """Enable OTEL auto-instrumentation for common libraries.
 
     Each instrumentation is optional — if the underlying library or
     instrumentation package isn't installed, it is silently skipped.
     """
+    from botanu.sdk.config import _parse_bool
+
     enabled: List[str] = []
     failed: List[tuple[str, str]] = []
 
-    # ── HTTP clients ──────────────────────────────────────────────
-    _try_instrument(enabled, failed, "httpx", "opentelemetry.instrumentation.httpx", "HTTPXClientInstrumentor")
-    _try_instrument(enabled, failed, "requests", "opentelemetry.instrumentation.requests", "RequestsInstrumentor")
-    _try_instrument(enabled, failed, "urllib3", "opentelemetry.instrumentation.urllib3", "URLLib3Instrumentor")
-    _try_instrument(enabled, failed, "urllib", "opentelemetry.instrumentation.urllib", "URLLibInstrumentor")
-    _try_instrument(
-        enabled, failed, "aiohttp_client", "opentelemetry.instrumentation.aiohttp_client", "AioHttpClientInstrumentor"
-    )
-    _try_instrument(
-        enabled, failed, "aiohttp_server", "opentelemetry.instrumentation.aiohttp_server", "AioHttpServerInstrumentor"
-    )
-
-    # ── Web frameworks ────────────────────────────────────────────
-    _try_instrument(enabled, failed, "fastapi", "opentelemetry.instrumentation.fastapi", "FastAPIInstrumentor")
-    _try_instrument(enabled, failed, "flask", "opentelemetry.instrumentation.flask", "FlaskInstrumentor")
-    _try_instrument(enabled, failed, "django", "opentelemetry.instrumentation.django", "DjangoInstrumentor")
-    _try_instrument(enabled, failed, "starlette", "opentelemetry.instrumentation.starlette", "StarletteInstrumentor")
-    _try_instrument(enabled, failed, "falcon", "opentelemetry.instrumentation.falcon", "FalconInstrumentor")
-    _try_instrument(enabled, failed, "pyramid", "opentelemetry.instrumentation.pyramid", "PyramidInstrumentor")
-    _try_instrument(enabled, failed, "tornado", "opentelemetry.instrumentation.tornado", "TornadoInstrumentor")
-
-    # ── Databases ─────────────────────────────────────────────────
-    _try_instrument(enabled, failed, "sqlalchemy", "opentelemetry.instrumentation.sqlalchemy", "SQLAlchemyInstrumentor")
-    _try_instrument(enabled, failed, "psycopg2", "opentelemetry.instrumentation.psycopg2", "Psycopg2Instrumentor")
-    _try_instrument(enabled, failed, "psycopg", "opentelemetry.instrumentation.psycopg", "PsycopgInstrumentor")
-    _try_instrument(enabled, failed, "asyncpg", "opentelemetry.instrumentation.asyncpg", "AsyncPGInstrumentor")
-    _try_instrument(enabled, failed, "aiopg", "opentelemetry.instrumentation.aiopg", "AiopgInstrumentor")
-    _try_instrument(enabled, failed, "pymongo", "opentelemetry.instrumentation.pymongo", "PymongoInstrumentor")
-    _try_instrument(enabled, failed, "redis", "opentelemetry.instrumentation.redis", "RedisInstrumentor")
-    _try_instrument(enabled, failed, "mysql", "opentelemetry.instrumentation.mysql", "MySQLInstrumentor")
-    _try_instrument(
-        enabled, failed, "mysqlclient", "opentelemetry.instrumentation.mysqlclient", "MySQLClientInstrumentor"
-    )
-    _try_instrument(enabled, failed, "pymysql", "opentelemetry.instrumentation.pymysql", "PyMySQLInstrumentor")
-    _try_instrument(enabled, failed, "sqlite3", "opentelemetry.instrumentation.sqlite3", "SQLite3Instrumentor")
-    _try_instrument(
-        enabled, failed, "elasticsearch", "opentelemetry.instrumentation.elasticsearch", "ElasticsearchInstrumentor"
-    )
-    _try_instrument(enabled, failed, "cassandra", "opentelemetry.instrumentation.cassandra", "CassandraInstrumentor")
-    _try_instrument(
-        enabled, failed, "tortoise_orm", "opentelemetry.instrumentation.tortoiseorm", "TortoiseORMInstrumentor"
-    )
-
-    # ── Caching ───────────────────────────────────────────────────
-    _try_instrument(enabled, failed, "pymemcache", "opentelemetry.instrumentation.pymemcache", "PymemcacheInstrumentor")
-
-    # ── Messaging / Task queues ───────────────────────────────────
-    _try_instrument(enabled, failed, "celery", "opentelemetry.instrumentation.celery", "CeleryInstrumentor")
-    _try_instrument(enabled, failed, "kafka-python", "opentelemetry.instrumentation.kafka_python", "KafkaInstrumentor")
-    _try_instrument(
-        enabled,
-        failed,
-        "confluent-kafka",
-        "opentelemetry.instrumentation.confluent_kafka",
-        "ConfluentKafkaInstrumentor",
-    )
-    _try_instrument(enabled, failed, "aiokafka", "opentelemetry.instrumentation.aiokafka", "AioKafkaInstrumentor")
-    _try_instrument(enabled, failed, "pika", "opentelemetry.instrumentation.pika", "PikaInstrumentor")
-    _try_instrument(enabled, failed, "aio-pika", "opentelemetry.instrumentation.aio_pika", "AioPikaInstrumentor")
+    # Gate on the instrumented library first: loading an instrumentation
+    # package pulls in wrapt and its shims even when the app never uses
+    # the library it targets.
+    rows = [row for row in _INSTRUMENTATIONS if row[1] in sys.modules or _module_available(row[1])]
 
-    # ── AWS ───────────────────────────────────────────────────────
-    _try_instrument(enabled, failed, "botocore", "opentelemetry.instrumentation.botocore", "BotocoreInstrumentor")
-    _try_instrument(enabled, failed, "boto3sqs", "opentelemetry.instrumentation.boto3sqs", "Boto3SQSInstrumentor")
+    if len(rows) > 1 and _parse_bool(os.getenv("BOTANU_PARALLEL_INSTRUMENT"), False):
+        _prefetch_instrumentors(rows)
 
-    # ── gRPC ──────────────────────────────────────────────────────
-    _try_instrument_grpc(enabled, failed)
-
-    # ── GenAI / AI ────────────────────────────────────────────────
-    _try_instrument(enabled, failed, "openai", "opentelemetry.instrumentation.openai_v2", "OpenAIInstrumentor")
-    _try_instrument(enabled, failed, "anthropic", "opentelemetry.instrumentation.anthropic", "AnthropicInstrumentor")
-    _try_instrument(enabled, failed, "vertexai", "opentelemetry.instrumentation.vertexai", "VertexAIInstrumentor")
-    _try_instrument(
-        enabled,
-        failed,
-        "google_genai",
-        "opentelemetry.instrumentation.google_generativeai",
-        "GoogleGenerativeAIInstrumentor",
-    )
-    _try_instrument(enabled, failed, "langchain", "opentelemetry.instrumentation.langchain", "LangchainInstrumentor")
-    _try_instrument(enabled, failed, "ollama", "opentelemetry.instrumentation.ollama", "OllamaInstrumentor")
-    _try_instrument(enabled, failed, "crewai", "opentelemetry.instrumentation.crewai", "CrewAIInstrumentor")
-
-    # ── Runtime / Concurrency ─────────────────────────────────────
-    _try_instrument(enabled, failed, "logging", "opentelemetry.instrumentation.logging", "LoggingInstrumentor")
-    _try_instrument(enabled, failed, "threading", "opentelemetry.instrumentation.threading", "ThreadingInstrumentor")
-    _try_instrument(enabled, failed, "asyncio", "opentelemetry.instrumentation.asyncio", "AsyncioInstrumentor")
+    for name, _library, module_path, class_name in rows:
+        _try_instrument(enabled, failed, name, module_path, class_name)
 
     if enabled:
         logger.info("Auto-instrumentation enabled: %s", ", ".join(enabled))
@@ -502,6 +528,29 @@ def _enable_auto_instrumentation() -> None:
             logger.warning("Auto-instrumentation failed for %s: %s", name, error)
 
 
+def _prefetch_instrumentors(rows: List[Tuple[str, str, str, str]]) -> None:
+    """Import instrumentation modules on a small thread pool.
+
+    Only the imports overlap (their file reads release the GIL); classes
+    land in ``_INSTRUMENTOR_CACHE`` and ``instrument()`` still runs serially
+    in table order, because instrumentors monkey-patch shared modules.
+    Failures are ignored here and reported by the serial pass.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    def resolve(row: Tuple[str, str, str, str]) -> None:
+        _name, _library, module_path, class_name = row
+        if (module_path, class_name) in _INSTRUMENTOR_CACHE or not _module_available(module_path):
+            return
+        try:
+            _INSTRUMENTOR_CACHE[(module_path, class_name)] = getattr(importlib.import_module(module_path), class_name)
+        except Exception:  # retried and reported by _try_instrument
+            pass
+
+    with ThreadPoolExecutor(max_workers=4, thread_name_prefix="botanu-instrument") as pool:
+        list(pool.map(resolve, rows))
+
+
 def _try_instrument(
     enabled: List[str],
     failed: List[tuple[str, str]],
@@ -510,12 +559,19 @@ def _try_instrument(
     class_name: str,
 ) -> None:
     """Try to import and instrument a single library."""
+    cache_key = (module_path, class_name)
+    instrumentor_cls = _INSTRUMENTOR_CACHE.get(cache_key)
+    if instrumentor_cls is None and not _module_available(module_path):
+        return
     try:
-        import importlib
-
-        mod = importlib.import_module(module_path)
-        instrumentor_cls = getattr(mod, class_name)
-        instrumentor_cls().instrument()
+        if instrumentor_cls is None:
+            instrumentor_cls = getattr(importlib.import_module(module_path), class_name)
+            _INSTRUMENTOR_CACHE[cache_key] = instrumentor_cls
+        instrumentor = instrumentor_cls()
+        # Still patched from an earlier enable() (disable() does not
+        # uninstrument); instrument() would only log a warning.
+        if not getattr(instrumentor, "is_instrumented_by_opentelemetry", False):
+            instrumentor.instrument()
         enabled.append(name)
     except ImportError:
         pass
@@ -523,24 +579,18 @@ def _try_instrument(
         failed.append((name, str(exc)))
 
 
-def _try_instrument_grpc(
-    enabled: List[str],
-    failed: List[tuple[str, str]],
-) -> None:
-    """Try to instrument gRPC (client + server)."""
-    try:
-        from opentelemetry.instrumentation.grpc import (
-            GrpcInstrumentorClient,
-            GrpcInstrumentorServer,
-        )
+def _module_available(module_path: str) -> bool:
+    """Return True if *module_path* can be imported, without importing it.
 
-        GrpcInstrumentorClient().instrument()
-        GrpcInstrumentorServer().instrument()
-        enabled.append("grpc")
-    except ImportError:
-        pass
-    except Exception as exc:
-        failed.append(("grpc", str(exc)))
+    ``find_spec`` only consults the import finders, so probing the ~50
+    instrumentation packages we know about — most of which are not
+    installed — skips a raised-and-caught ImportError for each one.
+    """
+    try:
+        return importlib.util.find_spec(module_path) is not None
+    except (ImportError, ValueError):
+        # Parent package missing (e.g. no opentelemetry-instrumentation).
+        return False
 
 
 def is_enabled() -> bool:
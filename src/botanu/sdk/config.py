@@ -20,12 +20,15 @@ Configuration precedence (highest to lowest):
 
 from __future__ import annotations
 
+import copy
+import functools
 import logging
 import os
 import re
+import sys
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional
 from urllib.parse import urlparse, urlunparse
 
 logger = logging.getLogger(__name__)
@@ -34,6 +37,38 @@ logger = logging.getLogger(__name__)
 _BOTANU_HOST_SUFFIXES = (".botanu.ai",)
 _BOTANU_DEV_HOSTS = frozenset({"localhost", "127.0.0.1", "::1", "0.0.0.0"})  # noqa: S104
 _SENSITIVE_HEADER_NAMES = frozenset({"authorization", "x-api-key", "botanu-api-key"})
+_TRUTHY_ENV_VALUES = frozenset({"true", "1", "yes", "y", "t", "on"})
+# ``dataclass(slots=True)`` needs Python 3.10+; on 3.9 the config keeps a
+# regular ``__dict__`` layout, as in botanu.models.run_context.
+_DATACLASS_SLOTS: Dict[str, bool] = {"slots": True} if sys.version_info >= (3, 10) else {}
+# Span export presets selected with ``export_profile``. Each one fills only
+# the fields left unset (``None``); explicit values, including ones equal to
+# the base default, and BOTANU_* env vars win. The queue stays at the
+# default ceiling in every profile so switching profiles never starts
+# dropping spans under bursts.
+_EXPORT_PROFILES: Dict[str, Dict[str, int]] = {
+    "default": {
+        "max_export_batch_size": 512,
+        "schedule_delay_millis": 5000,
+        "export_timeout_millis": 30000,
+    },
+    "high_throughput": {
+        "max_export_batch_size": 256,
+        "schedule_delay_millis": 1000,
+        "export_timeout_millis": 10000,
+    },
+    "low_latency": {
+        "max_export_batch_size": 128,
+        "schedule_delay_millis": 200,
+        "export_timeout_millis": 5000,
+    },
+}
+_DEFAULT_CONFIG_PATHS = (
+    "botanu.yaml",
+    "botanu.yml",
+    os.path.join("config", "botanu.yaml"),
+    os.path.join("config", "botanu.yml"),
+)
 
 
 def _is_botanu_trusted_endpoint(endpoint: Optional[str]) -> bool:
@@ -58,6 +93,18 @@ def _is_botanu_trusted_endpoint(endpoint: Optional[str]) -> bool:
     return any(host == suffix.lstrip(".") or host.endswith(suffix) for suffix in _BOTANU_HOST_SUFFIXES)
 
 
+def _signal_endpoint(endpoint: Optional[str], path: str) -> Optional[str]:
+    """Append the OTLP signal *path* (e.g. ``/v1/traces``) to a base endpoint.
+
+    Endpoints that already end with *path* (with or without a trailing
+    slash) are returned as-is, apart from dropping that slash.
+    """
+    if not endpoint or endpoint.endswith(path):
+        return endpoint
+    base = endpoint.rstrip("/")
+    return base if base.endswith(path) else base + path
+
+
 def _redact_url_credentials(url: Optional[str]) -> Optional[str]:
     """Strip `user:pass@` from a URL so it is safe to log."""
     if not url:
@@ -75,20 +122,21 @@ def _redact_url_credentials(url: Optional[str]) -> Optional[str]:
     return urlunparse(redacted)
 
 
+def _parse_bool(value: Optional[str], default: bool) -> bool:
+    """Parse a boolean env var value; *default* when the variable is unset."""
+    if value is None:
+        return default
+    return value.strip().casefold() in _TRUTHY_ENV_VALUES
+
+
 def _redact_headers(headers: Optional[Dict[str, str]]) -> Optional[Dict[str, str]]:
     """Return a copy of headers with sensitive values replaced by `***`."""
     if not headers:
         return headers
-    out: Dict[str, str] = {}
-    for key, value in headers.items():
-        if key.lower() in _SENSITIVE_HEADER_NAMES:
-            out[key] = "***"
-        else:
-            out[key] = value
-    return out
+    return {key: "***" if key.lower() in _SENSITIVE_HEADER_NAMES else value for key, value in headers.items()}
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class BotanuConfig:
     """Configuration for Botanu SDK and OpenTelemetry.
 
@@ -103,6 +151,9 @@ class BotanuConfig:
 
         >>> # Or load from YAML
         >>> config = BotanuConfig.from_yaml("config/botanu.yaml")
+
+    Instances use a slotted layout on Python 3.10+; subclasses should be
+    declared with ``@dataclass(slots=True)`` to keep it.
     """
 
     # Service identification
@@ -118,13 +169,24 @@ class BotanuConfig:
     otlp_endpoint: Optional[str] = None
     otlp_headers: Optional[Dict[str, str]] = None
 
+    # When False, enable() still enriches spans but attaches no OTLP span
+    # exporter / BatchSpanProcessor (no worker thread, no queue). Turned off
+    # by the standard OTEL_TRACES_EXPORTER=none.
+    traces_enabled: bool = True
+
     # Span export configuration
     # Large queue prevents span loss under burst traffic.
     # At ~1KB/span, 65536 spans ≈ 64MB memory ceiling.
-    max_export_batch_size: int = 512
+    # The batch size, delay and timeout are left as None until __post_init__
+    # resolves them from ``export_profile`` (default: 512 / 5000 / 30000).
+    max_export_batch_size: Optional[int] = None
     max_queue_size: int = 65536
-    schedule_delay_millis: int = 5000
-    export_timeout_millis: int = 30000
+    schedule_delay_millis: Optional[int] = None
+    export_timeout_millis: Optional[int] = None
+    # Preset for the numbers above: "default", "high_throughput"
+    # (shorter delay/timeout so a dead collector stalls the worker for 10s,
+    # not 30s) or "low_latency" (small, frequent batches).
+    export_profile: str = "default"
 
     # Content capture for eval — 0.10 default (~10% sample). Pre-2026-04-24
     # this defaulted to 0.0, which meant the default install silently
@@ -206,38 +268,44 @@ class BotanuConfig:
 
         Precedence: BOTANU_* > OTEL_* > defaults
         """
+        # Bound once for the ~20 lookups below. Deliberately not a copy:
+        # os.environ.copy() decodes every variable in the process (hundreds
+        # in a typical k8s pod) to serve a handful of reads.
+        env = os.environ
+
         if self.service_name is None:
-            self.service_name = os.getenv(
+            self.service_name = env.get(
                 "BOTANU_SERVICE_NAME",
-                os.getenv("OTEL_SERVICE_NAME", "unknown_service"),
+                env.get("OTEL_SERVICE_NAME", "unknown_service"),
             )
 
         if self.service_version is None:
-            self.service_version = os.getenv("OTEL_SERVICE_VERSION")
+            self.service_version = env.get("OTEL_SERVICE_VERSION")
 
         if self.service_namespace is None:
-            self.service_namespace = os.getenv("OTEL_SERVICE_NAMESPACE")
+            self.service_namespace = env.get("OTEL_SERVICE_NAMESPACE")
 
-        env_auto_detect = os.getenv("BOTANU_AUTO_DETECT_RESOURCES")
-        if env_auto_detect is not None:
-            self.auto_detect_resources = env_auto_detect.lower() in ("true", "1", "yes")
+        self.auto_detect_resources = _parse_bool(env.get("BOTANU_AUTO_DETECT_RESOURCES"), self.auto_detect_resources)
 
         if self.deployment_environment is None:
-            self.deployment_environment = os.getenv(
+            self.deployment_environment = env.get(
                 "BOTANU_ENVIRONMENT",
-                os.getenv("OTEL_DEPLOYMENT_ENVIRONMENT", "production"),
+                env.get("OTEL_DEPLOYMENT_ENVIRONMENT", "production"),
             )
 
-        botanu_api_key = os.getenv("BOTANU_API_KEY")
+        if env.get("OTEL_TRACES_EXPORTER", "").strip().lower() == "none":
+            self.traces_enabled = False
+
+        botanu_api_key = env.get("BOTANU_API_KEY")
 
         if self.otlp_endpoint is None:
-            botanu_endpoint = os.getenv("BOTANU_COLLECTOR_ENDPOINT")
+            botanu_endpoint = env.get("BOTANU_COLLECTOR_ENDPOINT")
             if botanu_endpoint:
                 self.otlp_endpoint = botanu_endpoint
             else:
                 env_endpoint = (
-                    os.getenv("OTEL_EXPORTER_OTLP_TRACES_ENDPOINT")
-                    or os.getenv("OTEL_EXPORTER_OTLP_ENDPOINT")
+                    env.get("OTEL_EXPORTER_OTLP_TRACES_ENDPOINT")
+                    or env.get("OTEL_EXPORTER_OTLP_ENDPOINT")
                 )
                 if env_endpoint:
                     self.otlp_endpoint = env_endpoint
@@ -278,50 +346,62 @@ class BotanuConfig:
                     urlparse(self.otlp_endpoint).hostname or "unknown",
                 )
 
+        self.export_profile = env.get("BOTANU_EXPORT_PROFILE", self.export_profile)
+        profile = _EXPORT_PROFILES.get(self.export_profile)
+        if profile is None:
+            logger.warning(
+                "Botanu SDK: unknown export_profile %r; expected one of %s. Using default export settings.",
+                self.export_profile,
+                ", ".join(_EXPORT_PROFILES),
+            )
+            self.export_profile = "default"
+            profile = _EXPORT_PROFILES["default"]
+        for name, value in profile.items():
+            if getattr(self, name) is None:
+                setattr(self, name, value)
+
         # Export tuning via env vars
-        env_queue_size = os.getenv("BOTANU_MAX_QUEUE_SIZE")
+        env_queue_size = env.get("BOTANU_MAX_QUEUE_SIZE")
         if env_queue_size:
             try:
                 self.max_queue_size = int(env_queue_size)
             except ValueError:
                 pass
 
-        env_batch_size = os.getenv("BOTANU_MAX_EXPORT_BATCH_SIZE")
+        env_batch_size = env.get("BOTANU_MAX_EXPORT_BATCH_SIZE")
         if env_batch_size:
             try:
                 self.max_export_batch_size = int(env_batch_size)
             except ValueError:
                 pass
 
-        env_export_timeout = os.getenv("BOTANU_EXPORT_TIMEOUT_MILLIS")
+        env_export_timeout = env.get("BOTANU_EXPORT_TIMEOUT_MILLIS")
         if env_export_timeout:
             try:
                 self.export_timeout_millis = int(env_export_timeout)
             except ValueError:
                 pass
 
-        env_content_rate = os.getenv("BOTANU_CONTENT_CAPTURE_RATE")
+        env_content_rate = env.get("BOTANU_CONTENT_CAPTURE_RATE")
         if env_content_rate is not None:
             try:
                 self.content_capture_rate = max(0.0, min(1.0, float(env_content_rate)))
             except ValueError:
                 pass
 
-        env_pii_enabled = os.getenv("BOTANU_PII_SCRUB_ENABLED")
-        if env_pii_enabled is not None:
-            self.pii_scrub_enabled = env_pii_enabled.lower() in ("true", "1", "yes")
+        self.pii_scrub_enabled = _parse_bool(env.get("BOTANU_PII_SCRUB_ENABLED"), self.pii_scrub_enabled)
 
-        env_pii_disable = os.getenv("BOTANU_PII_SCRUB_DISABLE_PATTERNS")
+        env_pii_disable = env.get("BOTANU_PII_SCRUB_DISABLE_PATTERNS")
         if env_pii_disable is not None:
             self.pii_scrub_disable_patterns = [
                 name.strip() for name in env_pii_disable.split(",") if name.strip()
             ]
 
-        env_pii_presidio = os.getenv("BOTANU_PII_SCRUB_USE_PRESIDIO")
-        if env_pii_presidio is not None:
-            self.pii_scrub_use_presidio = env_pii_presidio.lower() in ("true", "1", "yes")
+        self.pii_scrub_use_presidio = _parse_bool(
+            env.get("BOTANU_PII_SCRUB_USE_PRESIDIO"), self.pii_scrub_use_presidio
+        )
 
-        env_pii_replacement = os.getenv("BOTANU_PII_SCRUB_REPLACEMENT")
+        env_pii_replacement = env.get("BOTANU_PII_SCRUB_REPLACEMENT")
         if env_pii_replacement is not None:
             self.pii_scrub_replacement = env_pii_replacement
 
@@ -346,21 +426,25 @@ class BotanuConfig:
             raise FileNotFoundError("No config file path provided")
 
         resolved = Path(path)
-        if not resolved.exists():
-            raise FileNotFoundError(f"Config file not found: {resolved}")
+        # Let open() report a missing file rather than stat()-ing it first;
+        # from_file_or_env() has already probed the path once.
+        try:
+            with open(resolved) as fh:
+                raw_content = fh.read()
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Config file not found: {resolved}") from None
 
         try:
             import yaml  # type: ignore[import-untyped]
         except ImportError as err:
             raise ImportError("PyYAML required for YAML config. Install with: pip install pyyaml") from err
 
-        with open(resolved) as fh:
-            raw_content = fh.read()
-
         content = _interpolate_env_vars(raw_content)
 
         try:
-            data = yaml.safe_load(content)
+            # Deep-copied: the parsed tree is cached and _from_dict hands
+            # nested dicts (e.g. otlp.headers) straight to the config.
+            data = copy.deepcopy(_parse_yaml(content))
         except yaml.YAMLError as exc:
             raise ValueError(f"Invalid YAML in {resolved}: {exc}") from exc
 
@@ -380,32 +464,34 @@ class BotanuConfig:
         4. ``./config/botanu.yaml``
         5. Falls back to env-only config
         """
-        search_paths: List[Path] = []
-
-        if path:
-            search_paths.append(Path(path))
-
-        env_path = os.getenv("BOTANU_CONFIG_FILE")
-        if env_path:
-            search_paths.append(Path(env_path))
-
-        search_paths.extend(
-            [
-                Path("botanu.yaml"),
-                Path("botanu.yml"),
-                Path("config/botanu.yaml"),
-                Path("config/botanu.yml"),
-            ]
-        )
-
-        for candidate in search_paths:
-            if candidate.exists():
-                logger.info("Loading config from: %s", candidate)
-                return cls.from_yaml(str(candidate))
+        search = (path, os.getenv("BOTANU_CONFIG_FILE"), os.getcwd())
+        for _ in range(2):
+            try:
+                candidate = _find_config_file(*search)
+            except FileNotFoundError:
+                break
+            logger.info("Loading config from: %s", candidate)
+            try:
+                return cls.from_yaml(candidate)
+            except FileNotFoundError:
+                # The cached location was deleted since it was found; forget
+                # it and search once more.
+                _find_config_file.cache_clear()
 
         logger.debug("No config file found, using environment variables only")
         return cls()
 
+    @staticmethod
+    def invalidate_file_cache() -> None:
+        """Forget config file locations resolved by :meth:`from_file_or_env`.
+
+        Only found files are cached, and a cached file that has since been
+        deleted is searched for again automatically. Call this after adding
+        a file that should take precedence over the one already found (hot
+        reload, tests).
+        """
+        _find_config_file.cache_clear()
+
     @classmethod
     def _from_dict(
         cls,
@@ -429,10 +515,12 @@ class BotanuConfig:
             auto_detect_resources=resource.get("auto_detect", True),
             otlp_endpoint=otlp.get("endpoint"),
             otlp_headers=otlp.get("headers"),
-            max_export_batch_size=export.get("batch_size", 512),
+            traces_enabled=export.get("enabled", True),
+            max_export_batch_size=export.get("batch_size"),
             max_queue_size=export.get("queue_size", 65536),
-            schedule_delay_millis=export.get("delay_ms", 5000),
-            export_timeout_millis=export.get("export_timeout_ms", 30000),
+            schedule_delay_millis=export.get("delay_ms"),
+            export_timeout_millis=export.get("export_timeout_ms"),
+            export_profile=export.get("profile", "default"),
             content_capture_rate=max(0.0, min(1.0, float(eval_cfg.get("content_capture_rate", 0.10)))),
             pii_scrub_enabled=bool(pii_cfg.get("enabled", True)),
             pii_scrub_disable_patterns=pii_cfg.get("disable_patterns"),
@@ -443,6 +531,11 @@ class BotanuConfig:
             _config_file=config_file,
         )
 
+    @property
+    def traces_endpoint(self) -> Optional[str]:
+        """OTLP/HTTP traces URL: :attr:`otlp_endpoint` with ``/v1/traces`` appended if missing."""
+        return _signal_endpoint(self.otlp_endpoint, "/v1/traces")
+
     def to_dict(self) -> Dict[str, Any]:
         """Export configuration as dictionary. Sensitive header values are redacted."""
         return {
@@ -460,10 +553,12 @@ class BotanuConfig:
                 "headers": _redact_headers(self.otlp_headers),
             },
             "export": {
+                "enabled": self.traces_enabled,
                 "batch_size": self.max_export_batch_size,
                 "queue_size": self.max_queue_size,
                 "delay_ms": self.schedule_delay_millis,
                 "export_timeout_ms": self.export_timeout_millis,
+                "profile": self.export_profile,
             },
             "eval": {
                 "content_capture_rate": self.content_capture_rate,
@@ -498,18 +593,68 @@ class BotanuConfig:
         )
 
 
+@functools.lru_cache(maxsize=4)
+def _find_config_file(path: Optional[str], env_path: Optional[str], cwd: str) -> str:
+    """Return the first existing config file in search order.
+
+    Keyed on the explicit path, ``BOTANU_CONFIG_FILE`` and the working
+    directory so repeat lookups skip the filesystem probes. *cwd* only
+    serves as part of the cache key; relative candidates resolve against it.
+
+    Raises:
+        FileNotFoundError: If no candidate exists. ``lru_cache`` does not
+            store exceptions, so only hits are memoized and a file created
+            later is still found.
+    """
+    for candidate in _config_candidates(path, env_path):
+        if os.path.isfile(candidate):
+            return candidate
+    raise FileNotFoundError("No config file found")
+
+
+def _config_candidates(path: Optional[str], env_path: Optional[str]) -> Iterator[str]:
+    """Yield config file locations in search order."""
+    if path:
+        yield path
+    if env_path:
+        yield env_path
+    yield from _DEFAULT_CONFIG_PATHS
+
+
+@functools.lru_cache(maxsize=8)
+def _parse_yaml(content: str) -> Any:
+    """Parse YAML text, memoized on the post-interpolation content.
+
+    Keyed on the interpolated text, so an edited file or a changed
+    ``${VAR}`` value is simply a cache miss. Kept in memory only: the
+    interpolated text can carry secrets such as ``${BOTANU_API_KEY}``.
+    """
+    import yaml  # type: ignore[import-untyped]
+
+    # libyaml-backed loader when PyYAML was built with it (the default for
+    # PyPI wheels); same safe-load semantics, several times faster.
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    return yaml.load(content, Loader=loader)  # noqa: S506 - always a safe loader
+
+
+_ENV_VAR_RE = re.compile(r"\$\{([A-Za-z_][A-Za-z0-9_]*)(?::-([^}]*))?\}")
+
+
 def _interpolate_env_vars(content: str) -> str:
     """Interpolate ``${VAR_NAME}`` and ``${VAR_NAME:-default}`` in *content*."""
-    pattern = re.compile(r"\$\{([A-Za-z_][A-Za-z0-9_]*)(?::-([^}]*))?\}")
+    if "${" not in content:
+        # Common for dev configs; a substring scan is far cheaper than a regex pass.
+        return content
+    getenv = os.getenv
 
     def _replace(match: re.Match) -> str:  # type: ignore[type-arg]
         var_name = match.group(1)
         default = match.group(2)
-        value = os.getenv(var_name)
+        value = getenv(var_name)
         if value is not None:
             return value
         if default is not None:
             return default
         return match.group(0)
 
-    return pattern.sub(_replace, content)
+    return _ENV_VAR_RE.sub(_replace, content)
@@ -8,10 +8,36 @@ Uses OpenTelemetry Context and Baggage for propagation.
 
 from __future__ import annotations
 
-from typing import Optional, cast
+from contextlib import contextmanager
+from typing import Dict, Iterable, Iterator, Mapping, Optional, cast
 
 from opentelemetry import baggage, trace
-from opentelemetry.context import attach, get_current
+from opentelemetry.context import Context, attach, detach, get_current, set_value
+
+try:
+    # Private, but stable since the baggage API was introduced (see the
+    # same guard in botanu.processors.enricher).
+    from opentelemetry.baggage import _BAGGAGE_KEY
+except ImportError:  # pragma: no cover - fall back to the public API
+    _BAGGAGE_KEY = None  # type: ignore[assignment]
+
+
+def _merge_baggage(values: Mapping[str, str], context: Optional[Context] = None) -> Context:
+    """Return a context with all ``values`` added to its baggage.
+
+    ``baggage.set_baggage`` copies the whole baggage dict and the context
+    per key; this copies each once no matter how many keys are set.
+    Falls back to chained ``set_baggage`` calls if the private context key
+    is unavailable.
+    """
+    ctx = get_current() if context is None else context
+    if _BAGGAGE_KEY is None:
+        for key, value in values.items():
+            ctx = baggage.set_baggage(key, value, context=ctx)
+        return ctx
+    entries = dict(baggage.get_all(context=ctx))
+    entries.update(values)
+    return set_value(_BAGGAGE_KEY, entries, context=ctx)
 
 
 def set_baggage(key: str, value: str) -> object:
@@ -27,8 +53,8 @@ def set_baggage(key: str, value: str) -> object:
         scope ends, otherwise the context stack grows unboundedly (memory
         leak in long-running processes).
 
-        For setting multiple keys, prefer building the context manually
-        and attaching once — see ``decorators.py`` for the pattern.
+        For scoped values, prefer :func:`baggage_scope`, which attaches
+        once for any number of keys and always detaches.
 
     Args:
         key: Baggage key (e.g., ``"botanu.run_id"``).
@@ -41,6 +67,23 @@ def set_baggage(key: str, value: str) -> object:
     return attach(ctx)
 
 
+@contextmanager
+def baggage_scope(values: Mapping[str, str]) -> Iterator[None]:
+    """Set baggage values for the duration of a ``with`` block.
+
+    All keys go into one new context, attached once and detached on exit
+    (including on exceptions), so the context stack cannot leak.
+
+    Args:
+        values: Baggage keys and values (e.g., ``{"botanu.tenant_id": "t-1"}``).
+    """
+    token = attach(_merge_baggage(values))
+    try:
+        yield
+    finally:
+        detach(token)
+
+
 def get_baggage(key: str) -> Optional[str]:
     """Get a baggage value from the current context.
 
@@ -54,6 +97,23 @@ def get_baggage(key: str) -> Optional[str]:
     return cast(Optional[str], value)
 
 
+def get_baggage_bulk(keys: Iterable[str]) -> Dict[str, Optional[str]]:
+    """Get several baggage values from a single read of the current context.
+
+    Cheaper than calling :func:`get_baggage` per key when a caller needs
+    most of the run context at once (e.g. to stamp outgoing message
+    metadata).
+
+    Args:
+        keys: Baggage keys to look up.
+
+    Returns:
+        Mapping of each requested key to its value, or ``None`` if not set.
+    """
+    entries = baggage.get_all(context=get_current())
+    return {key: cast(Optional[str], entries.get(key)) for key in keys}
+
+
 def get_current_span() -> trace.Span:
     """Get the current active span.
 
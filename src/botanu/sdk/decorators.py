@@ -16,12 +16,11 @@ that:
 from __future__ import annotations
 
 import functools
-import hashlib
 import inspect
-import json
+import os
+import sys
 from contextlib import contextmanager
-from datetime import datetime, timezone
-from typing import Any, Callable, Dict, Generator, Optional, TypeVar, Union
+from typing import Any, Callable, Dict, Generator, Optional, Tuple, TypeVar, Union
 
 from opentelemetry import baggage as otel_baggage
 from opentelemetry import trace
@@ -29,14 +28,25 @@ from opentelemetry.context import attach, detach, get_current
 from opentelemetry.trace import SpanKind, Status, StatusCode
 
 from botanu.models.run_context import RunContext, RunStatus
-from botanu.sdk.context import get_baggage
+from botanu.sdk.context import _merge_baggage
 
 T = TypeVar("T")
 
 tracer = trace.get_tracer("botanu_sdk")
 
+# Keys written or looked up on every run. Dotted literals are not
+# auto-interned by CPython; interning lets dict lookups match by pointer.
+_KEY_RUN_ID = sys.intern("botanu.run_id")
+_KEY_RUN_DURATION_MS = sys.intern("botanu.run.duration_ms")
+_EVENT_RUN_STARTED = sys.intern("botanu.run.started")
+_EVENT_RUN_COMPLETED = sys.intern("botanu.run.completed")
+
 
 def _compute_workflow_version(func: Callable[..., Any]) -> str:
+    # Runs once per decorated function, on its first call; keeps hashlib
+    # (and OpenSSL) off the import path.
+    import hashlib
+
     try:
         source = inspect.getsource(func)
         code_hash = hashlib.sha256(source.encode()).hexdigest()
@@ -45,8 +55,77 @@ def _compute_workflow_version(func: Callable[..., Any]) -> str:
         return "v:unknown"
 
 
-def _get_parent_run_id() -> Optional[str]:
-    return get_baggage("botanu.run_id")
+def _is_async_callable(func: Callable[..., Any]) -> bool:
+    """Return True if calling *func* returns an awaitable coroutine.
+
+    Evaluated once per decorated function. Besides plain ``async def``
+    (and partials of one), this recognises compiled coroutine functions
+    (Cython, mypyc), which lack ``CO_COROUTINE`` but carry asyncio's
+    ``_is_coroutine`` marker, and objects with an ``async def __call__``.
+    """
+    if inspect.iscoroutinefunction(func):
+        return True
+    marker = getattr(func, "_is_coroutine", None)
+    if marker is not None:
+        import asyncio.coroutines
+
+        return marker is getattr(asyncio.coroutines, "_is_coroutine", None)
+    if inspect.isroutine(func):
+        return False
+    return inspect.iscoroutinefunction(type(func).__call__)
+
+
+def _resolver(value: Union[str, Callable[..., str]]) -> Callable[..., str]:
+    """Return *value* if callable, else a function that ignores its args and returns it.
+
+    Lets the decorator wrappers call one resolver per id without a
+    ``callable()`` branch on every invocation.
+    """
+    if callable(value):
+        return value
+
+    def constant(*args: Any, **kwargs: Any) -> str:
+        return value
+
+    return constant
+
+
+def _wrap(wrapper: Callable[..., Any], func: Callable[..., Any]) -> Callable[..., Any]:
+    """Copy *func*'s metadata onto *wrapper*, like ``functools.wraps``.
+
+    Plain functions take an unrolled fast path; anything missing one of
+    the attributes (partials, callable objects) falls back to
+    ``functools.update_wrapper``, which skips absent attributes.
+    """
+    try:
+        wrapper.__module__ = func.__module__
+        wrapper.__name__ = func.__name__
+        wrapper.__qualname__ = func.__qualname__
+        wrapper.__doc__ = func.__doc__
+        wrapper.__annotations__ = func.__annotations__
+        wrapper.__dict__.update(func.__dict__)
+    except AttributeError:
+        return functools.update_wrapper(wrapper, func)
+    wrapper.__wrapped__ = func  # type: ignore[attr-defined]
+    return wrapper
+
+
+# Enum ``.value`` goes through a descriptor on every access; resolve once.
+_STATUS_VALUES: Dict[RunStatus, str] = {status: status.value for status in RunStatus}
+
+
+def _default_emit_events() -> bool:
+    # Read per event() rather than at import, like BOTANU_ENVIRONMENT, so
+    # env changes made after importing botanu still apply. Imported lazily
+    # so importing the decorators does not pull in the config module.
+    from botanu.sdk.config import _parse_bool
+
+    return _parse_bool(os.environ.get("BOTANU_EMIT_EVENTS"), True)
+
+
+# Bound straight to the OTel API (which reads the current context when none
+# is passed), skipping two Python frames per run.
+_get_parent_run_id: Callable[[], Optional[str]] = functools.partial(otel_baggage.get_baggage, _KEY_RUN_ID)  # type: ignore[assignment]
 
 
 # ── Content capture ───────────────────────────────────────────────────────
@@ -59,13 +138,22 @@ def _get_parent_run_id() -> Optional[str]:
 _CAPTURE_MAX_CHARS = 4096
 
 
+@functools.cache
+def _capture_hooks() -> Tuple[Callable[..., bool], Callable[[], Any]]:
+    # Resolved on the first sampling decision instead of on every call;
+    # importing at module load would pull bootstrap (and the OTel SDK) in
+    # with botanu.sdk.decorators.
+    from botanu.sampling.content_sampler import should_capture_content
+    from botanu.sdk.bootstrap import get_config
+
+    return should_capture_content, get_config
+
+
 def _should_capture_content() -> bool:
     """Single decision per event invocation — applied to both input + output
     so we never land a half-captured pair."""
     try:
-        from botanu.sampling.content_sampler import should_capture_content
-        from botanu.sdk.bootstrap import get_config
-
+        should_capture_content, get_config = _capture_hooks()
         cfg = get_config()
         rate = cfg.content_capture_rate if cfg else 0.0
         return should_capture_content(rate)
@@ -79,6 +167,8 @@ def _serialize_for_capture(obj: Any) -> str:
     PII scrub runs after serialization and before truncation so the regex
     sees the joined string (catches e.g. an email spanning dict values).
     """
+    import json  # only reached for sampled content capture
+
     try:
         text = json.dumps(obj, default=repr, ensure_ascii=False)
     except Exception:
@@ -125,24 +215,30 @@ def _emit_run_completed(
     run_ctx: RunContext,
     status: RunStatus,
     error_class: Optional[str] = None,
+    emit_event: bool = True,
 ) -> None:
-    duration_ms = (datetime.now(timezone.utc) - run_ctx.start_time).total_seconds() * 1000
+    duration_ms = run_ctx.elapsed_ms
+    if not emit_event:
+        span.set_attribute(_KEY_RUN_DURATION_MS, duration_ms)
+        return
 
     event_attrs: Dict[str, Union[str, float]] = {
         "run_id": run_ctx.run_id,
         "workflow": run_ctx.workflow,
-        "status": status.value,
+        "status": _STATUS_VALUES[status],
         "duration_ms": duration_ms,
     }
     if error_class:
         event_attrs["error_class"] = error_class
-    if run_ctx.outcome and run_ctx.outcome.value_type:
-        event_attrs["value_type"] = run_ctx.outcome.value_type
-    if run_ctx.outcome and run_ctx.outcome.value_amount is not None:
-        event_attrs["value_amount"] = run_ctx.outcome.value_amount
+    outcome = run_ctx.outcome
+    if outcome is not None:
+        if outcome.value_type:
+            event_attrs["value_type"] = outcome.value_type
+        if outcome.value_amount is not None:
+            event_attrs["value_amount"] = outcome.value_amount
 
-    span.add_event("botanu.run.completed", attributes=event_attrs)
-    span.set_attribute("botanu.run.duration_ms", duration_ms)
+    span.add_event(_EVENT_RUN_COMPLETED, attributes=event_attrs)
+    span.set_attribute(_KEY_RUN_DURATION_MS, duration_ms)
 
 
 # ── Unified primary API: botanu.event + botanu.step ──────────────────────
@@ -178,6 +274,7 @@ class _Event:
         auto_outcome_on_success: bool = True,
         capture_input: Optional[bool] = None,
         span_kind: SpanKind = SpanKind.SERVER,
+        emit_events: Optional[bool] = None,
     ) -> None:
         if not workflow or not isinstance(workflow, str):
             raise ValueError("workflow is required and must be a non-empty string")
@@ -190,17 +287,23 @@ class _Event:
 
         self.event_id = event_id
         self.customer_id = customer_id
+        self._resolve_event_id = _resolver(event_id)
+        self._resolve_customer_id = _resolver(customer_id)
         self.workflow = workflow
         self.environment = environment
         self.tenant_id = tenant_id
         self.auto_outcome_on_success = auto_outcome_on_success
         self.capture_input = capture_input
         self.span_kind = span_kind
+        self.emit_events = _default_emit_events() if emit_events is None else emit_events
 
         self._span_cm: Any = None
         self._span: Optional[trace.Span] = None
         self._baggage_token: Any = None
         self._run_ctx: Optional[RunContext] = None
+        # RunContext factories keyed by workflow_version, so the fields fixed
+        # per event (workflow, environment, tenant) are resolved once.
+        self._run_factories: Dict[Optional[str], Callable[..., RunContext]] = {}
 
     def _begin(
         self,
@@ -208,48 +311,54 @@ class _Event:
         resolved_customer_id: str,
         workflow_version: Optional[str] = None,
     ):
-        parent_run_id = _get_parent_run_id()
-        run_ctx = RunContext.create(
-            workflow=self.workflow,
-            event_id=resolved_event_id,
-            customer_id=resolved_customer_id,
-            workflow_version=workflow_version,
-            environment=self.environment,
-            tenant_id=self.tenant_id,
-            parent_run_id=parent_run_id,
-        )
+        make_run = self._run_factories.get(workflow_version)
+        if make_run is None:
+            # Built on first use, not at decoration (import) time, so the
+            # default environment still sees .env files loaded after import.
+            make_run = RunContext.factory(
+                workflow=self.workflow,
+                workflow_version=workflow_version,
+                environment=self.environment,
+                tenant_id=self.tenant_id,
+            )
+            self._run_factories[workflow_version] = make_run
+        run_ctx = make_run(resolved_event_id, resolved_customer_id, parent_run_id=_get_parent_run_id())
         span_cm = tracer.start_as_current_span(
             name=f"botanu.run/{self.workflow}",
             kind=self.span_kind,
         )
         span = span_cm.__enter__()
-        for key, value in run_ctx.to_span_attributes().items():
-            span.set_attribute(key, value)
-        span.add_event(
-            "botanu.run.started",
-            attributes={"run_id": run_ctx.run_id, "workflow": run_ctx.workflow},
-        )
-        ctx = get_current()
-        for key, value in run_ctx.to_baggage_dict().items():
-            ctx = otel_baggage.set_baggage(key, value, context=ctx)
-        baggage_token = attach(ctx)
+        # Non-recording spans (no-op tracer, sampled out) discard attributes
+        # and events, so skip building them. Baggage is still propagated:
+        # downstream services may record even when this process does not.
+        if span.is_recording():
+            span.set_attributes(run_ctx.to_span_attributes())
+            if self.emit_events:
+                span.add_event(
+                    _EVENT_RUN_STARTED,
+                    attributes={"run_id": run_ctx.run_id, "workflow": run_ctx.workflow},
+                )
+        baggage_token = attach(_merge_baggage(run_ctx.to_baggage_dict()))
         return span_cm, span, baggage_token, run_ctx
 
     def _end_success(self, span_cm, span, baggage_token, run_ctx) -> None:
         if self.auto_outcome_on_success:
             run_ctx.complete(RunStatus.SUCCESS)
-        span.set_status(Status(StatusCode.OK))
-        _emit_run_completed(span, run_ctx, RunStatus.SUCCESS)
+        if span.is_recording():
+            span.set_status(Status(StatusCode.OK))
+            _emit_run_completed(span, run_ctx, RunStatus.SUCCESS, emit_event=self.emit_events)
         detach(baggage_token)
         span_cm.__exit__(None, None, None)
 
     def _end_failure(self, span_cm, span, baggage_token, run_ctx, exc) -> None:
-        span.set_status(Status(StatusCode.ERROR, str(exc)))
-        span.record_exception(exc)
-        run_ctx.complete(RunStatus.FAILURE, error_class=exc.__class__.__name__)
-        _emit_run_completed(
-            span, run_ctx, RunStatus.FAILURE, error_class=exc.__class__.__name__,
-        )
+        error_class = exc.__class__.__name__
+        run_ctx.complete(RunStatus.FAILURE, error_class=error_class)
+        if span.is_recording():
+            span.set_status(Status(StatusCode.ERROR, str(exc)))
+            span.record_exception(exc)
+            _emit_run_completed(
+                span, run_ctx, RunStatus.FAILURE, error_class=error_class, emit_event=self.emit_events,
+            )
         detach(baggage_token)
         span_cm.__exit__(type(exc), exc, exc.__traceback__)
 
@@ -260,6 +369,23 @@ class _Event:
             return False
         return _should_capture_content()
 
+    # Shared by the sync and async decorator wrappers, which differ only
+    # in how they invoke the wrapped function.
+    def _start_call(self, func: Callable[..., Any], workflow_version: str, args: tuple, kwargs: dict) -> tuple:
+        event_id = self._resolve_event_id(*args, **kwargs)
+        customer_id = self._resolve_customer_id(*args, **kwargs)
+        span_cm, span, token, run_ctx = self._begin(event_id, customer_id, workflow_version)
+        capture = span.is_recording() and self._resolve_capture()
+        if capture:
+            _capture_input(span, func, args, kwargs)
+        return span_cm, span, token, run_ctx, capture
+
+    def _finish_call(self, state: tuple, result: Any) -> None:
+        span_cm, span, token, run_ctx, capture = state
+        if capture:
+            _capture_output(span, result)
+        self._end_success(span_cm, span, token, run_ctx)
+
     # ── Sync context manager ──
     def __enter__(self) -> RunContext:
         if callable(self.event_id) or callable(self.customer_id):
@@ -296,47 +422,40 @@ class _Event:
 
     # ── Decorator ──
     def __call__(self, func: Callable[..., T]) -> Callable[..., T]:
-        workflow_version = _compute_workflow_version(func)
-        is_async = inspect.iscoroutinefunction(func)
+        # Fingerprinting reads the source file, so defer it from decoration
+        # (module import) to the first call.
+        @functools.cache
+        def workflow_version() -> str:
+            return _compute_workflow_version(func)
+
         parent = self
 
-        @functools.wraps(func)
-        async def async_wrapper(*args: Any, **kwargs: Any) -> T:
-            eid = parent.event_id(*args, **kwargs) if callable(parent.event_id) else parent.event_id
-            cid = parent.customer_id(*args, **kwargs) if callable(parent.customer_id) else parent.customer_id
-            span_cm, span, token, run_ctx = parent._begin(eid, cid, workflow_version)
-            capture = parent._resolve_capture()
-            if capture:
-                _capture_input(span, func, args, kwargs)
-            try:
-                result = await func(*args, **kwargs)
-                if capture:
-                    _capture_output(span, result)
-                parent._end_success(span_cm, span, token, run_ctx)
+        # Only the wrapper that will be returned is defined and decorated.
+        if _is_async_callable(func):
+
+            async def async_wrapper(*args: Any, **kwargs: Any) -> T:
+                state = parent._start_call(func, workflow_version(), args, kwargs)
+                try:
+                    result = await func(*args, **kwargs)
+                except Exception as exc:
+                    parent._end_failure(*state[:4], exc)
+                    raise
+                parent._finish_call(state, result)
                 return result
-            except Exception as exc:
-                parent._end_failure(span_cm, span, token, run_ctx, exc)
-                raise
 
-        @functools.wraps(func)
+            return _wrap(async_wrapper, func)  # type: ignore[return-value]
+
         def sync_wrapper(*args: Any, **kwargs: Any) -> T:
-            eid = parent.event_id(*args, **kwargs) if callable(parent.event_id) else parent.event_id
-            cid = parent.customer_id(*args, **kwargs) if callable(parent.customer_id) else parent.customer_id
-            span_cm, span, token, run_ctx = parent._begin(eid, cid, workflow_version)
-            capture = parent._resolve_capture()
-            if capture:
-                _capture_input(span, func, args, kwargs)
+            state = parent._start_call(func, workflow_version(), args, kwargs)
             try:
                 result = func(*args, **kwargs)
-                if capture:
-                    _capture_output(span, result)
-                parent._end_success(span_cm, span, token, run_ctx)
-                return result
             except Exception as exc:
-                parent._end_failure(span_cm, span, token, run_ctx, exc)
+                parent._end_failure(*state[:4], exc)
                 raise
+            parent._finish_call(state, result)
+            return result
 
-        return async_wrapper if is_async else sync_wrapper  # type: ignore[return-value]
+        return _wrap(sync_wrapper, func)
 
 
 def _ensure_enabled() -> None:
@@ -358,6 +477,7 @@ def event(
     auto_outcome_on_success: bool = True,
     capture_input: Optional[bool] = None,
     span_kind: SpanKind = SpanKind.SERVER,
+    emit_events: Optional[bool] = None,
 ) -> _Event:
     """Mark a scope as a botanu business event — the primary integration point.
 
@@ -380,6 +500,11 @@ def event(
         capture_input: Force content capture on/off. ``None`` (default) uses
             the sampled ``content_capture_rate`` from bootstrap config.
         span_kind: OpenTelemetry span kind (default: ``SERVER``).
+        emit_events: Record the ``botanu.run.started`` / ``botanu.run.completed``
+            span events. ``None`` (default) follows ``BOTANU_EMIT_EVENTS``
+            (on when unset, parsed like the other boolean env vars). Run
+            identity, status and ``botanu.run.duration_ms`` are still
+            written when off.
 
     Examples::
 
@@ -415,6 +540,7 @@ def event(
         auto_outcome_on_success=auto_outcome_on_success,
         capture_input=capture_input,
         span_kind=span_kind,
+        emit_events=emit_events,
     )
 
 
@@ -9,23 +9,89 @@ spans with Botanu-specific context.
 
 from __future__ import annotations
 
-import uuid
+import os
+import sys
+from typing import Dict, List, Optional
 
 from opentelemetry import baggage as otel_baggage
 from opentelemetry import trace
-from opentelemetry.context import attach, detach, get_current
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.requests import Request
-from starlette.responses import Response
+from opentelemetry.context import attach, detach
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
+from botanu.sdk.context import _merge_baggage
 
-class BotanuMiddleware(BaseHTTPMiddleware):
+# Baggage / span keys, interned to match the RunContext and enricher keys
+# by pointer (dotted literals are not auto-interned).
+_KEY_RUN_ID = sys.intern("botanu.run_id")
+_KEY_WORKFLOW = sys.intern("botanu.workflow")
+_KEY_CUSTOMER_ID = sys.intern("botanu.customer_id")
+
+# ASGI servers deliver header names lowercased, so these match raw keys.
+_H_RUN_ID = b"x-botanu-run-id"
+_H_WORKFLOW = b"x-botanu-workflow"
+_H_CUSTOMER_ID = b"x-botanu-customer-id"
+
+_RUN_ID_POOL_SIZE = 256
+
+# 32-hex-digit UUID4 bodies cut from a single ``os.urandom`` read; the
+# dashes are added on pop.
+_run_id_pool: List[str] = []
+
+
+def _refill_run_id_pool() -> str:
+    buf = bytearray(os.urandom(16 * _RUN_ID_POOL_SIZE))
+    # Stamp the RFC 4122 version (4) and variant bits into every chunk.
+    buf[6::16] = bytes((b & 0x0F) | 0x40 for b in buf[6::16])
+    buf[8::16] = bytes((b & 0x3F) | 0x80 for b in buf[8::16])
+    digits = buf.hex()
+    _run_id_pool.extend(digits[i : i + 32] for i in range(32, len(digits), 32))
+    return digits[:32]
+
+
+def _clear_run_id_pool() -> None:
+    _run_id_pool.clear()
+
+
+# A forked child would otherwise hand out the same pooled IDs as its parent
+# (gunicorn/celery prefork, multiprocessing).
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_clear_run_id_pool)
+
+
+def _next_run_id() -> str:
+    """Return a random UUID4 string, refilling the entropy pool when empty.
+
+    Amortises the ``os.urandom`` syscall over ``_RUN_ID_POOL_SIZE`` requests
+    instead of paying it on every ``uuid.uuid4()`` call, and formats the
+    canonical 8-4-4-4-12 form by slicing hex digits rather than building
+    a ``uuid.UUID`` object.
+    """
+    try:
+        h = _run_id_pool.pop()
+    except IndexError:
+        h = _refill_run_id_pool()
+    return f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}"
+
+
+def _header(headers: Dict[bytes, bytes], name: bytes) -> Optional[str]:
+    """Decode a raw ASGI header value, or return ``None`` if absent."""
+    value = headers.get(name)
+    return None if value is None else value.decode("latin-1")
+
+
+class BotanuMiddleware:
     """FastAPI middleware to enrich spans with Botanu context.
 
     This middleware should be used **after** OpenTelemetry's
     ``FastAPIInstrumentor``.  It extracts Botanu context from incoming
     requests and enriches the current span with Botanu attributes.
 
+    Implemented as a plain ASGI callable rather than on
+    ``BaseHTTPMiddleware``, which runs each request in an extra task group
+    and memory stream. The downstream app runs in the same task, so the
+    attached baggage is visible to it directly.
+
     Example::
 
         from fastapi import FastAPI
@@ -42,55 +108,56 @@ class BotanuMiddleware(BaseHTTPMiddleware):
 
     def __init__(
         self,
-        app: object,
+        app: ASGIApp,
         *,
         workflow: str,
         auto_generate_run_id: bool = True,
     ) -> None:
-        super().__init__(app)  # type: ignore[arg-type]
+        self.app = app
         self.workflow = workflow
         self.auto_generate_run_id = auto_generate_run_id
 
-    async def dispatch(self, request: Request, call_next: object) -> Response:  # type: ignore[override]
-        """Process request and enrich span with Botanu context."""
-        span = trace.get_current_span()
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Enrich the current span and baggage, then run the wrapped app."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
 
-        run_id = otel_baggage.get_baggage("botanu.run_id")
-        if not run_id:
-            run_id = request.headers.get("x-botanu-run-id")
+        span = trace.get_current_span()
+        headers = dict(scope["headers"])
 
+        run_id = otel_baggage.get_baggage(_KEY_RUN_ID) or _header(headers, _H_RUN_ID)
         if not run_id and self.auto_generate_run_id:
-            run_id = str(uuid.uuid4())
-
-        workflow = (
-            otel_baggage.get_baggage("botanu.workflow") or request.headers.get("x-botanu-workflow") or self.workflow
-        )
-        customer_id = otel_baggage.get_baggage("botanu.customer_id") or request.headers.get("x-botanu-customer-id")
+            run_id = _next_run_id()
 
-        if run_id:
-            span.set_attribute("botanu.run_id", run_id)
-        span.set_attribute("botanu.workflow", workflow)
-        if customer_id:
-            span.set_attribute("botanu.customer_id", customer_id)
+        workflow = otel_baggage.get_baggage(_KEY_WORKFLOW) or _header(headers, _H_WORKFLOW) or self.workflow
+        customer_id = otel_baggage.get_baggage(_KEY_CUSTOMER_ID) or _header(headers, _H_CUSTOMER_ID)
 
-        span.set_attribute("http.route", request.url.path)
-        span.set_attribute("http.method", request.method)
-
-        ctx = get_current()
+        entries = {_KEY_WORKFLOW: workflow}
         if run_id:
-            ctx = otel_baggage.set_baggage("botanu.run_id", run_id, context=ctx)
-        ctx = otel_baggage.set_baggage("botanu.workflow", workflow, context=ctx)
+            entries[_KEY_RUN_ID] = run_id
         if customer_id:
-            ctx = otel_baggage.set_baggage("botanu.customer_id", customer_id, context=ctx)
-
-        baggage_token = attach(ctx)
+            entries[_KEY_CUSTOMER_ID] = customer_id
+
+        if span.is_recording():
+            span.set_attributes(
+                {
+                    **entries,
+                    "http.route": scope.get("root_path", "") + scope["path"],
+                    "http.method": scope["method"],
+                }
+            )
+
+        async def send_with_botanu_headers(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                response_headers = MutableHeaders(scope=message)
+                if run_id:
+                    response_headers["x-botanu-run-id"] = run_id
+                response_headers["x-botanu-workflow"] = workflow
+            await send(message)
+
+        baggage_token = attach(_merge_baggage(entries))
         try:
-            response = await call_next(request)  # type: ignore[misc]
+            await self.app(scope, receive, send_with_botanu_headers)
         finally:
             detach(baggage_token)
-
-        if run_id:
-            response.headers["x-botanu-run-id"] = run_id
-        response.headers["x-botanu-workflow"] = workflow
-
-        return response
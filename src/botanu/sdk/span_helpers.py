@@ -9,7 +9,7 @@ These functions add Botanu-specific attributes to the current span.
 from __future__ import annotations
 
 import logging
-from typing import Optional
+from typing import Any, Optional
 
 from opentelemetry import trace
 
@@ -41,20 +41,26 @@ def emit_outcome(
         metadata: Additional diagnostic key-value metadata.
     """
     span = trace.get_current_span()
+    # Non-recording spans (tracing off, or sampled out) drop everything.
+    if not span.is_recording():
+        return
 
+    attrs: dict[str, Any] = {}
     if value_type:
-        span.set_attribute("botanu.outcome.value_type", value_type)
+        attrs["botanu.outcome.value_type"] = value_type
     if value_amount is not None:
-        span.set_attribute("botanu.outcome.value_amount", value_amount)
+        attrs["botanu.outcome.value_amount"] = value_amount
     if confidence is not None:
-        span.set_attribute("botanu.outcome.confidence", confidence)
+        attrs["botanu.outcome.confidence"] = confidence
     if reason:
-        span.set_attribute("botanu.outcome.reason", reason)
+        attrs["botanu.outcome.reason"] = reason
     if error_type:
-        span.set_attribute("botanu.outcome.error_type", error_type)
+        attrs["botanu.outcome.error_type"] = error_type
     if metadata:
         for key, value in metadata.items():
-            span.set_attribute(f"botanu.outcome.metadata.{key}", value)
+            attrs[f"botanu.outcome.metadata.{key}"] = value
+    if attrs:
+        span.set_attributes(attrs)
 
     event_attrs: dict[str, object] = {}
     if value_type:
@@ -82,6 +88,8 @@ def set_business_context(
         region: Geographic region.
     """
     span = trace.get_current_span()
+    if not span.is_recording():
+        return
 
     if customer_id:
         span.set_attribute("botanu.customer_id", customer_id)
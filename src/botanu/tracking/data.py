@@ -14,14 +14,26 @@ Usage::
 
 from __future__ import annotations
 
+import sys
+import time
 from contextlib import contextmanager
 from dataclasses import dataclass, field
-from datetime import datetime, timezone
-from typing import Any, Dict, Generator, Optional
+from functools import lru_cache
+from typing import Any, Dict, FrozenSet, Generator, Optional
 
 from opentelemetry import trace
 from opentelemetry.trace import Span, SpanKind, Status, StatusCode
 
+# Resolved once; before a provider is installed these are proxies that bind
+# to it on first use, so importing this module early is safe.
+_db_tracer = trace.get_tracer("botanu.data")
+_storage_tracer = trace.get_tracer("botanu.storage")
+_messaging_tracer = trace.get_tracer("botanu.messaging")
+
+# ``dataclass(slots=True)`` needs Python 3.10+; on 3.9 the trackers keep a
+# regular ``__dict__`` layout, as in botanu.models.run_context.
+_DATACLASS_SLOTS: Dict[str, bool] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
 # =========================================================================
 # System Normalization Maps
 # =========================================================================
@@ -91,6 +103,36 @@ MESSAGING_SYSTEMS: Dict[str, str] = {
     "celery": "celery",
 }
 
+# Canonical names map to themselves, so an exact hit needs no lowercasing
+# or table lookup — the common case when callers pass the constants.
+_DB_CANONICAL = frozenset(DB_SYSTEMS.values())
+_STORAGE_CANONICAL = frozenset(STORAGE_SYSTEMS.values())
+_MESSAGING_CANONICAL = frozenset(MESSAGING_SYSTEMS.values())
+
+
+def _normalize_system(system: str, aliases: Dict[str, str], canonical: FrozenSet[str]) -> str:
+    if system in canonical:
+        return system
+    lowered = system.lower()
+    return aliases.get(lowered, lowered)
+
+
+# Span names and attribute keys are built from a small set of systems,
+# operations and metadata keys; memoising them avoids an f-string (and a
+# ``lower()``) per tracked operation.
+@lru_cache(maxsize=256)
+def _span_name(kind: str, system: str, operation: str) -> str:
+    return f"{kind}.{system}.{operation.lower()}"
+
+
+@lru_cache(maxsize=256)
+def _attr_key(namespace: str, key: str) -> str:
+    return f"{namespace}.{key}"
+
+
+def _metadata_key(namespace: str, key: str) -> str:
+    return key if key.startswith("botanu.") else _attr_key(namespace, key)
+
 
 class DBOperation:
     SELECT = "SELECT"
@@ -125,19 +167,23 @@ class MessagingOperation:
     SUBSCRIBE = "subscribe"
 
 
+# Messaging operations traced as PRODUCER spans; everything else is CONSUMER.
+_PRODUCER_OPS = frozenset({MessagingOperation.PUBLISH, MessagingOperation.SEND})
+
+
 # =========================================================================
 # Database Tracker
 # =========================================================================
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class DBTracker:
     """Tracks database operations."""
 
     system: str
     operation: str
     span: Optional[Span] = field(default=None, repr=False)
-    start_time: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    start_ns: int = field(default_factory=time.perf_counter_ns, repr=False)
 
     rows_returned: int = 0
     rows_affected: int = 0
@@ -156,21 +202,25 @@ class DBTracker:
         self.bytes_read = bytes_read
         self.bytes_written = bytes_written
         if self.span:
+            attrs: Dict[str, int] = {}
             if rows_returned > 0:
-                self.span.set_attribute("botanu.data.rows_returned", rows_returned)
+                attrs["botanu.data.rows_returned"] = rows_returned
             if rows_affected > 0:
-                self.span.set_attribute("botanu.data.rows_affected", rows_affected)
+                attrs["botanu.data.rows_affected"] = rows_affected
             if bytes_read > 0:
-                self.span.set_attribute("botanu.data.bytes_read", bytes_read)
+                attrs["botanu.data.bytes_read"] = bytes_read
             if bytes_written > 0:
-                self.span.set_attribute("botanu.data.bytes_written", bytes_written)
+                attrs["botanu.data.bytes_written"] = bytes_written
+            if attrs:
+                self.span.set_attributes(attrs)
         return self
 
     def set_table(self, table_name: str, schema: Optional[str] = None) -> DBTracker:
         if self.span:
-            self.span.set_attribute("db.collection.name", table_name)
+            attrs = {"db.collection.name": table_name}
             if schema:
-                self.span.set_attribute("db.schema", schema)
+                attrs["db.schema"] = schema
+            self.span.set_attributes(attrs)
         return self
 
     def set_query_id(self, query_id: str) -> DBTracker:
@@ -223,16 +273,14 @@ class DBTracker:
         return self
 
     def add_metadata(self, **kwargs: Any) -> DBTracker:
-        if self.span:
-            for key, value in kwargs.items():
-                attr_key = key if key.startswith("botanu.") else f"botanu.data.{key}"
-                self.span.set_attribute(attr_key, value)
+        if self.span and kwargs:
+            self.span.set_attributes({_metadata_key("botanu.data", key): value for key, value in kwargs.items()})
         return self
 
     def _finalize(self) -> None:
         if not self.span:
             return
-        duration_ms = (datetime.now(timezone.utc) - self.start_time).total_seconds() * 1000
+        duration_ms = (time.perf_counter_ns() - self.start_ns) / 1_000_000
         self.span.set_attribute("botanu.data.duration_ms", duration_ms)
 
 
@@ -253,22 +301,24 @@ def track_db_operation(
         cloud_provider: Explicit cloud tag (``"aws"``/``"gcp"``/``"azure"``).
             Overrides the inference done by :class:`ResourceEnricher`.
     """
-    tracer = trace.get_tracer("botanu.data")
-    normalized_system = DB_SYSTEMS.get(system.lower(), system.lower())
+    normalized_system = _normalize_system(system, DB_SYSTEMS, _DB_CANONICAL)
 
-    with tracer.start_as_current_span(
-        name=f"db.{normalized_system}.{operation.lower()}",
+    with _db_tracer.start_as_current_span(
+        name=_span_name("db", normalized_system, operation),
         kind=SpanKind.CLIENT,
     ) as span:
-        span.set_attribute("db.system", normalized_system)
-        span.set_attribute("db.operation", operation.upper())
-        span.set_attribute("botanu.vendor", normalized_system)
+        attrs: Dict[str, Any] = {
+            "db.system": normalized_system,
+            "db.operation": operation.upper(),
+            "botanu.vendor": normalized_system,
+        }
         if database:
-            span.set_attribute("db.name", database)
+            attrs["db.name"] = database
         if cloud_provider:
-            span.set_attribute("botanu.cloud_provider", cloud_provider.lower())
+            attrs["botanu.cloud_provider"] = cloud_provider.lower()
         for key, value in kwargs.items():
-            span.set_attribute(f"botanu.data.{key}", value)
+            attrs[_attr_key("botanu.data", key)] = value
+        span.set_attributes(attrs)
 
         tracker = DBTracker(system=normalized_system, operation=operation, span=span)
         try:
@@ -285,14 +335,14 @@ def track_db_operation(
 # =========================================================================
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class StorageTracker:
     """Tracks storage operations."""
 
     system: str
     operation: str
     span: Optional[Span] = field(default=None, repr=False)
-    start_time: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    start_ns: int = field(default_factory=time.perf_counter_ns, repr=False)
 
     objects_count: int = 0
     bytes_read: int = 0
@@ -308,12 +358,15 @@ class StorageTracker:
         self.bytes_read = bytes_read
         self.bytes_written = bytes_written
         if self.span:
+            attrs: Dict[str, int] = {}
             if objects_count > 0:
-                self.span.set_attribute("botanu.data.objects_count", objects_count)
+                attrs["botanu.data.objects_count"] = objects_count
             if bytes_read > 0:
-                self.span.set_attribute("botanu.data.bytes_read", bytes_read)
+                attrs["botanu.data.bytes_read"] = bytes_read
             if bytes_written > 0:
-                self.span.set_attribute("botanu.data.bytes_written", bytes_written)
+                attrs["botanu.data.bytes_written"] = bytes_written
+            if attrs:
+                self.span.set_attributes(attrs)
         return self
 
     def set_bucket(self, bucket: str) -> StorageTracker:
@@ -334,16 +387,14 @@ class StorageTracker:
         return self
 
     def add_metadata(self, **kwargs: Any) -> StorageTracker:
-        if self.span:
-            for key, value in kwargs.items():
-                attr_key = key if key.startswith("botanu.") else f"botanu.storage.{key}"
-                self.span.set_attribute(attr_key, value)
+        if self.span and kwargs:
+            self.span.set_attributes({_metadata_key("botanu.storage", key): value for key, value in kwargs.items()})
         return self
 
     def _finalize(self) -> None:
         if not self.span:
             return
-        duration_ms = (datetime.now(timezone.utc) - self.start_time).total_seconds() * 1000
+        duration_ms = (time.perf_counter_ns() - self.start_ns) / 1_000_000
         self.span.set_attribute("botanu.storage.duration_ms", duration_ms)
 
 
@@ -361,20 +412,22 @@ def track_storage_operation(
         operation: Type of operation (GET, PUT, DELETE, …).
         cloud_provider: Explicit cloud tag. Overrides inference.
     """
-    tracer = trace.get_tracer("botanu.storage")
-    normalized_system = STORAGE_SYSTEMS.get(system.lower(), system.lower())
+    normalized_system = _normalize_system(system, STORAGE_SYSTEMS, _STORAGE_CANONICAL)
 
-    with tracer.start_as_current_span(
-        name=f"storage.{normalized_system}.{operation.lower()}",
+    with _storage_tracer.start_as_current_span(
+        name=_span_name("storage", normalized_system, operation),
         kind=SpanKind.CLIENT,
     ) as span:
-        span.set_attribute("botanu.storage.system", normalized_system)
-        span.set_attribute("botanu.storage.operation", operation.upper())
-        span.set_attribute("botanu.vendor", normalized_system)
+        attrs: Dict[str, Any] = {
+            "botanu.storage.system": normalized_system,
+            "botanu.storage.operation": operation.upper(),
+            "botanu.vendor": normalized_system,
+        }
         if cloud_provider:
-            span.set_attribute("botanu.cloud_provider", cloud_provider.lower())
+            attrs["botanu.cloud_provider"] = cloud_provider.lower()
         for key, value in kwargs.items():
-            span.set_attribute(f"botanu.storage.{key}", value)
+            attrs[_attr_key("botanu.storage", key)] = value
+        span.set_attributes(attrs)
 
         tracker = StorageTracker(system=normalized_system, operation=operation, span=span)
         try:
@@ -391,7 +444,7 @@ def track_storage_operation(
 # =========================================================================
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class MessagingTracker:
     """Tracks messaging operations."""
 
@@ -399,7 +452,7 @@ class MessagingTracker:
     operation: str
     destination: str
     span: Optional[Span] = field(default=None, repr=False)
-    start_time: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    start_ns: int = field(default_factory=time.perf_counter_ns, repr=False)
 
     message_count: int = 0
     bytes_transferred: int = 0
@@ -412,10 +465,13 @@ class MessagingTracker:
         self.message_count = message_count
         self.bytes_transferred = bytes_transferred
         if self.span:
+            attrs: Dict[str, int] = {}
             if message_count > 0:
-                self.span.set_attribute("botanu.messaging.message_count", message_count)
+                attrs["botanu.messaging.message_count"] = message_count
             if bytes_transferred > 0:
-                self.span.set_attribute("botanu.messaging.bytes_transferred", bytes_transferred)
+                attrs["botanu.messaging.bytes_transferred"] = bytes_transferred
+            if attrs:
+                self.span.set_attributes(attrs)
         return self
 
     def set_error(self, error: Exception) -> MessagingTracker:
@@ -431,16 +487,14 @@ class MessagingTracker:
         return self
 
     def add_metadata(self, **kwargs: Any) -> MessagingTracker:
-        if self.span:
-            for key, value in kwargs.items():
-                attr_key = key if key.startswith("botanu.") else f"botanu.messaging.{key}"
-                self.span.set_attribute(attr_key, value)
+        if self.span and kwargs:
+            self.span.set_attributes({_metadata_key("botanu.messaging", key): value for key, value in kwargs.items()})
         return self
 
     def _finalize(self) -> None:
         if not self.span:
             return
-        duration_ms = (datetime.now(timezone.utc) - self.start_time).total_seconds() * 1000
+        duration_ms = (time.perf_counter_ns() - self.start_ns) / 1_000_000
         self.span.set_attribute("botanu.messaging.duration_ms", duration_ms)
 
 
@@ -460,22 +514,24 @@ def track_messaging_operation(
         destination: Queue/topic name.
         cloud_provider: Explicit cloud tag. Overrides inference.
     """
-    tracer = trace.get_tracer("botanu.messaging")
-    normalized_system = MESSAGING_SYSTEMS.get(system.lower(), system.lower())
-    span_kind = SpanKind.PRODUCER if operation in ("publish", "send") else SpanKind.CONSUMER
+    normalized_system = _normalize_system(system, MESSAGING_SYSTEMS, _MESSAGING_CANONICAL)
+    span_kind = SpanKind.PRODUCER if operation in _PRODUCER_OPS else SpanKind.CONSUMER
 
-    with tracer.start_as_current_span(
-        name=f"messaging.{normalized_system}.{operation.lower()}",
+    with _messaging_tracer.start_as_current_span(
+        name=_span_name("messaging", normalized_system, operation),
         kind=span_kind,
     ) as span:
-        span.set_attribute("messaging.system", normalized_system)
-        span.set_attribute("messaging.operation", operation.lower())
-        span.set_attribute("messaging.destination.name", destination)
-        span.set_attribute("botanu.vendor", normalized_system)
+        attrs: Dict[str, Any] = {
+            "messaging.system": normalized_system,
+            "messaging.operation": operation.lower(),
+            "messaging.destination.name": destination,
+            "botanu.vendor": normalized_system,
+        }
         if cloud_provider:
-            span.set_attribute("botanu.cloud_provider", cloud_provider.lower())
+            attrs["botanu.cloud_provider"] = cloud_provider.lower()
         for key, value in kwargs.items():
-            span.set_attribute(f"botanu.messaging.{key}", value)
+            attrs[_attr_key("botanu.messaging", key)] = value
+        span.set_attributes(attrs)
 
         tracker = MessagingTracker(
             system=normalized_system,
@@ -510,16 +566,19 @@ def set_data_metrics(
     if not target_span or not target_span.is_recording():
         return
 
+    attrs: Dict[str, int] = {}
     if rows_returned > 0:
-        target_span.set_attribute("botanu.data.rows_returned", rows_returned)
+        attrs["botanu.data.rows_returned"] = rows_returned
     if rows_affected > 0:
-        target_span.set_attribute("botanu.data.rows_affected", rows_affected)
+        attrs["botanu.data.rows_affected"] = rows_affected
     if bytes_read > 0:
-        target_span.set_attribute("botanu.data.bytes_read", bytes_read)
+        attrs["botanu.data.bytes_read"] = bytes_read
     if bytes_written > 0:
-        target_span.set_attribute("botanu.data.bytes_written", bytes_written)
+        attrs["botanu.data.bytes_written"] = bytes_written
     if objects_count > 0:
-        target_span.set_attribute("botanu.data.objects_count", objects_count)
+        attrs["botanu.data.objects_count"] = objects_count
+    if attrs:
+        target_span.set_attributes(attrs)
 
 
 def set_warehouse_metrics(
@@ -534,9 +593,12 @@ def set_warehouse_metrics(
     if not target_span or not target_span.is_recording():
         return
 
-    target_span.set_attribute("botanu.warehouse.query_id", query_id)
-    target_span.set_attribute("botanu.warehouse.bytes_scanned", bytes_scanned)
+    attrs: Dict[str, Any] = {
+        "botanu.warehouse.query_id": query_id,
+        "botanu.warehouse.bytes_scanned": bytes_scanned,
+    }
     if rows_returned > 0:
-        target_span.set_attribute("botanu.data.rows_returned", rows_returned)
+        attrs["botanu.data.rows_returned"] = rows_returned
     if partitions_scanned > 0:
-        target_span.set_attribute("botanu.warehouse.partitions_scanned", partitions_scanned)
+        attrs["botanu.warehouse.partitions_scanned"] = partitions_scanned
+    target_span.set_attributes(attrs)
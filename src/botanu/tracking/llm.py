@@ -32,9 +32,11 @@ from opentelemetry import metrics, trace
 from opentelemetry.trace import Span, SpanKind, Status, StatusCode
 
 # Context variable for automatic retry detection (set by tenacity integration).
-# Default 0 means "not set by retry callback"; 1+ means the attempt number.
+# _RETRY_NOT_ACTIVE (0) means "no retry loop in flight" — readers skip the
+# attempt attribute entirely; 1+ means the attempt number.
+_RETRY_NOT_ACTIVE = 0
 _retry_attempt: contextvars.ContextVar[int] = contextvars.ContextVar(
-    "botanu_retry_attempt", default=0
+    "botanu_retry_attempt", default=_RETRY_NOT_ACTIVE
 )
 
 # =========================================================================
@@ -489,7 +491,7 @@ def track_llm_call(
 
         # Auto-detect retry attempt from tenacity integration.
         ctx_attempt = _retry_attempt.get()
-        if ctx_attempt > 0:
+        if ctx_attempt != _RETRY_NOT_ACTIVE:
             tracker.set_attempt(ctx_attempt)
 
         try:
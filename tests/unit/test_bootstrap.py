@@ -8,7 +8,7 @@ from __future__ import annotations
 import os
 from unittest import mock
 
-from botanu.sdk.config import BotanuConfig
+from botanu.sdk.config import BotanuConfig, _signal_endpoint
 
 # ---------------------------------------------------------------------------
 # Config env-var precedence: BOTANU_* > OTEL_* > defaults
@@ -155,23 +155,10 @@ class TestAutoInstrumentationCoverage:
     """Verify all expected instrumentations are wired in _enable_auto_instrumentation."""
 
     def _get_instrumentation_names(self) -> list[str]:
-        """Extract all instrumentation names from the bootstrap source."""
-        import ast
-        import inspect
-
-        from botanu.sdk.bootstrap import _enable_auto_instrumentation
+        """Names of all instrumentations wired in the bootstrap table."""
+        from botanu.sdk.bootstrap import _INSTRUMENTATIONS
 
-        source = inspect.getsource(_enable_auto_instrumentation)
-        names: list[str] = []
-        # Parse all _try_instrument calls and extract the 'name' argument
-        tree = ast.parse(source)
-        for node in ast.walk(tree):
-            if isinstance(node, ast.Call) and isinstance(node.func, ast.Name):
-                if node.func.id == "_try_instrument" and len(node.args) >= 3:
-                    name_arg = node.args[2]
-                    if isinstance(name_arg, ast.Constant):
-                        names.append(name_arg.value)
-        return names
+        return [row[0] for row in _INSTRUMENTATIONS]
 
     # ── HTTP clients ──────────────────────────────────────────────
 
@@ -287,6 +274,13 @@ class TestAutoInstrumentationCoverage:
     def test_boto3sqs_instrumented(self):
         assert "boto3sqs" in self._get_instrumentation_names()
 
+    # ── gRPC ──────────────────────────────────────────────────────
+
+    def test_grpc_client_and_server_instrumented(self):
+        names = self._get_instrumentation_names()
+        assert "grpc_client" in names
+        assert "grpc_server" in names
+
     # ── GenAI / AI ────────────────────────────────────────────────
 
     def test_openai_instrumented(self):
@@ -339,6 +333,78 @@ class TestTryInstrument:
         assert enabled == []
         assert failed == []
 
+    def test_missing_package_not_imported(self):
+        from botanu.sdk.bootstrap import _try_instrument
+
+        with mock.patch("importlib.import_module") as import_module:
+            _try_instrument([], [], "nonexistent", "nonexistent.module", "FooInstrumentor")
+        import_module.assert_not_called()
+
+    def test_uninstalled_library_skips_instrumentation_import(self):
+        from botanu.sdk import bootstrap
+
+        rows = (("nolib", "botanu_test_missing_library", "os", "FooInstrumentor"),)
+        with mock.patch.object(bootstrap, "_INSTRUMENTATIONS", rows), mock.patch.object(
+            bootstrap, "_try_instrument"
+        ) as try_instrument:
+            bootstrap._enable_auto_instrumentation()
+        try_instrument.assert_not_called()
+
+    def test_instrumentor_class_cached_across_calls(self):
+        from botanu.sdk import bootstrap
+
+        instrumentor_cls = mock.MagicMock()
+        instrumentor_cls.return_value.is_instrumented_by_opentelemetry = False
+        fake_module = mock.MagicMock(FakeInstrumentor=instrumentor_cls)
+        with mock.patch.dict(bootstrap._INSTRUMENTOR_CACHE, clear=True), mock.patch.object(
+            bootstrap, "_module_available", return_value=True
+        ), mock.patch("importlib.import_module", return_value=fake_module) as import_module:
+            bootstrap._try_instrument([], [], "fake", "fake.module", "FakeInstrumentor")
+            bootstrap._try_instrument([], [], "fake", "fake.module", "FakeInstrumentor")
+
+        import_module.assert_called_once_with("fake.module")
+        assert instrumentor_cls.return_value.instrument.call_count == 2
+
+    def test_already_instrumented_not_reinstrumented(self):
+        from botanu.sdk import bootstrap
+
+        instrumentor_cls = mock.MagicMock()
+        instrumentor_cls.return_value.is_instrumented_by_opentelemetry = True
+        enabled: list[str] = []
+        with mock.patch.dict(bootstrap._INSTRUMENTOR_CACHE, {("fake.module", "FakeInstrumentor"): instrumentor_cls}):
+            bootstrap._try_instrument(enabled, [], "fake", "fake.module", "FakeInstrumentor")
+
+        instrumentor_cls.return_value.instrument.assert_not_called()
+        assert enabled == ["fake"]
+
+    def test_parallel_prefetch_is_opt_in(self):
+        from botanu.sdk import bootstrap
+
+        rows = (("a", "json", "json", "JSONDecoder"), ("b", "json", "json", "JSONEncoder"))
+        with mock.patch.object(bootstrap, "_INSTRUMENTATIONS", rows), mock.patch.object(
+            bootstrap, "_prefetch_instrumentors"
+        ) as prefetch, mock.patch.object(bootstrap, "_try_instrument"):
+            with mock.patch.dict(os.environ, {"BOTANU_PARALLEL_INSTRUMENT": "false"}):
+                bootstrap._enable_auto_instrumentation()
+            prefetch.assert_not_called()
+            with mock.patch.dict(os.environ, {"BOTANU_PARALLEL_INSTRUMENT": "true"}):
+                bootstrap._enable_auto_instrumentation()
+            prefetch.assert_called_once()
+
+    def test_prefetch_populates_cache_and_skips_missing(self):
+        import json
+
+        from botanu.sdk import bootstrap
+
+        rows = [
+            ("a", "json", "json", "JSONDecoder"),
+            ("b", "json", "json", "NoSuchInstrumentor"),
+            ("c", "json", "nonexistent.module", "FooInstrumentor"),
+        ]
+        with mock.patch.dict(bootstrap._INSTRUMENTOR_CACHE, clear=True):
+            bootstrap._prefetch_instrumentors(rows)
+            assert bootstrap._INSTRUMENTOR_CACHE == {("json", "JSONDecoder"): json.JSONDecoder}
+
     def test_instrument_error_recorded(self):
         from botanu.sdk.bootstrap import _try_instrument
 
@@ -383,6 +449,21 @@ class TestEnableDisable:
             bootstrap._initialized = original_init
             bootstrap._current_config = original_cfg
 
+    def test_enable_when_initialized_skips_lock(self):
+        from botanu.sdk import bootstrap
+
+        original_init = bootstrap._initialized
+        original_pid = bootstrap._initialized_pid
+        bootstrap._initialized = True
+        bootstrap._initialized_pid = os.getpid()
+        try:
+            with mock.patch.object(bootstrap, "_lock") as lock:
+                assert bootstrap.enable() is False
+            lock.__enter__.assert_not_called()
+        finally:
+            bootstrap._initialized = original_init
+            bootstrap._initialized_pid = original_pid
+
 
 # ---------------------------------------------------------------------------
 # Bootstrap: endpoint normalization in bootstrap
@@ -398,11 +479,7 @@ class TestEndpointNormalization:
             cfg = BotanuConfig()
             assert cfg.otlp_endpoint == "http://collector:4318"
 
-            # Simulate what bootstrap does
-            traces_endpoint = cfg.otlp_endpoint
-            if traces_endpoint and not traces_endpoint.endswith("/v1/traces"):
-                traces_endpoint = f"{traces_endpoint.rstrip('/')}/v1/traces"
-            assert traces_endpoint == "http://collector:4318/v1/traces"
+            assert cfg.traces_endpoint == "http://collector:4318/v1/traces"
 
     def test_traces_endpoint_not_doubled(self):
         """If already ends with /v1/traces, don't append again."""
@@ -414,10 +491,7 @@ class TestEndpointNormalization:
             cfg = BotanuConfig()
             assert cfg.otlp_endpoint == "http://collector:4318/v1/traces"
 
-            traces_endpoint = cfg.otlp_endpoint
-            if traces_endpoint and not traces_endpoint.endswith("/v1/traces"):
-                traces_endpoint = f"{traces_endpoint.rstrip('/')}/v1/traces"
-            assert traces_endpoint == "http://collector:4318/v1/traces"
+            assert cfg.traces_endpoint == "http://collector:4318/v1/traces"
 
     def test_botanu_endpoint_gets_v1_traces_appended(self):
         """BOTANU_COLLECTOR_ENDPOINT also gets /v1/traces appended by bootstrap."""
@@ -429,10 +503,7 @@ class TestEndpointNormalization:
             cfg = BotanuConfig()
             assert cfg.otlp_endpoint == "http://my-collector:4318"
 
-            traces_endpoint = cfg.otlp_endpoint
-            if traces_endpoint and not traces_endpoint.endswith("/v1/traces"):
-                traces_endpoint = f"{traces_endpoint.rstrip('/')}/v1/traces"
-            assert traces_endpoint == "http://my-collector:4318/v1/traces"
+            assert cfg.traces_endpoint == "http://my-collector:4318/v1/traces"
 
     def test_trailing_slash_handled(self):
         """Trailing slash on base endpoint should not cause double slash."""
@@ -442,10 +513,16 @@ class TestEndpointNormalization:
             clear=True,
         ):
             cfg = BotanuConfig()
-            traces_endpoint = cfg.otlp_endpoint
-            if traces_endpoint and not traces_endpoint.endswith("/v1/traces"):
-                traces_endpoint = f"{traces_endpoint.rstrip('/')}/v1/traces"
-            assert traces_endpoint == "http://collector:4318/v1/traces"
+            assert cfg.traces_endpoint == "http://collector:4318/v1/traces"
+
+    def test_full_traces_path_with_trailing_slash(self):
+        assert _signal_endpoint("http://collector:4318/v1/traces/", "/v1/traces") == "http://collector:4318/v1/traces"
+
+    def test_logs_endpoint(self):
+        assert _signal_endpoint("http://collector:4318", "/v1/logs") == "http://collector:4318/v1/logs"
+
+    def test_empty_endpoint_passthrough(self):
+        assert _signal_endpoint(None, "/v1/traces") is None
 
 
 # ---------------------------------------------------------------------------
@@ -453,6 +530,27 @@ class TestEndpointNormalization:
 # ---------------------------------------------------------------------------
 
 
+class TestResolveLogLevel:
+    """Tests for mapping enable(log_level=...) names to logging levels."""
+
+    def test_known_names_case_insensitive(self):
+        import logging
+
+        from botanu.sdk.bootstrap import _resolve_log_level
+
+        assert _resolve_log_level("debug") == logging.DEBUG
+        assert _resolve_log_level("WARNING") == logging.WARNING
+
+    def test_non_level_attribute_falls_back_to_info(self):
+        import logging
+
+        from botanu.sdk.bootstrap import _resolve_log_level
+
+        # getattr(logging, "BASIC_FORMAT") is a format string, not a level.
+        assert _resolve_log_level("basic_format") == logging.INFO
+        assert _resolve_log_level("verbose") == logging.INFO
+
+
 class TestBootstrapThreadSafety:
     """Verify that enable() is thread-safe."""
 
@@ -778,6 +876,54 @@ class TestBrownfieldDetection:
         finally:
             self._restore_bootstrap()
 
+    def test_explicit_resource_attrs_win_over_detected(self):
+        from opentelemetry.sdk.resources import Resource
+
+        from botanu.sdk import bootstrap
+
+        detected = {"service.name": "detected-svc", "host.name": "detected-host"}
+        self._reset_bootstrap()
+        try:
+            with mock.patch("botanu.resources._cached_resource_attrs", return_value=detected), mock.patch.object(
+                Resource, "create", wraps=Resource.create
+            ) as create, mock.patch("opentelemetry.trace.set_tracer_provider"):
+                bootstrap.enable(
+                    service_name="explicit-svc",
+                    otlp_endpoint="http://localhost:4318",
+                    auto_instrumentation=False,
+                )
+
+            attrs = create.call_args[0][0]
+            assert attrs["service.name"] == "explicit-svc"
+            assert attrs["host.name"] == "detected-host"
+            assert "service.version" not in attrs
+        finally:
+            self._restore_bootstrap()
+
+    def test_traces_disabled_skips_batch_processor(self):
+        from botanu.sdk import bootstrap
+
+        self._reset_bootstrap()
+        try:
+            with mock.patch.dict(os.environ, {"OTEL_TRACES_EXPORTER": "none"}), mock.patch(
+                "opentelemetry.sdk.trace.export.BatchSpanProcessor"
+            ) as batch, mock.patch("opentelemetry.trace.set_tracer_provider") as set_provider:
+                result = bootstrap.enable(
+                    service_name="no-export-svc",
+                    otlp_endpoint="http://localhost:4318",
+                    auto_instrumentation=False,
+                )
+
+            assert result is True
+            batch.assert_not_called()
+            provider = set_provider.call_args[0][0]
+            procs = provider._active_span_processor._span_processors
+            # Existing test-provider processors are migrated first; botanu adds
+            # only its enrichers.
+            assert [type(p).__name__ for p in procs[-2:]] == ["RunContextEnricher", "ResourceEnricher"]
+        finally:
+            self._restore_bootstrap()
+
     def test_enable_called_twice_returns_false(self):
         """Second call to enable() returns False without re-initializing."""
         from botanu.sdk import bootstrap
@@ -6,6 +6,7 @@
 from __future__ import annotations
 
 import os
+import sys
 from unittest import mock
 
 import pytest
@@ -29,6 +30,10 @@ class TestInterpolateEnvVars:
         result = _interpolate_env_vars("endpoint: http://localhost")
         assert result == "endpoint: http://localhost"
 
+    def test_content_without_placeholders_returned_unchanged(self):
+        content = "endpoint: http://localhost\nprice: $5\n"
+        assert _interpolate_env_vars(content) is content
+
     def test_default_value_when_unset(self):
         result = _interpolate_env_vars("endpoint: ${UNSET_VAR:-default_value}")
         assert result == "endpoint: default_value"
@@ -83,6 +88,13 @@ class TestBotanuConfigDefaults:
             config = BotanuConfig(service_name="explicit-service")
             assert config.service_name == "explicit-service"
 
+    @pytest.mark.skipif(sys.version_info < (3, 10), reason="dataclass slots require Python 3.10+")
+    def test_uses_slots_layout(self):
+        config = BotanuConfig(service_name="slots")
+        assert not hasattr(config, "__dict__")
+        assert config.auto_instrument_packages is not BotanuConfig().auto_instrument_packages
+
+
 class TestBotanuConfigFromYaml:
     """Tests for loading config from YAML."""
 
@@ -115,6 +127,23 @@ otlp:
         assert config.otlp_endpoint == "http://localhost:4318"
         assert config.otlp_headers == {"Authorization": "Bearer token123"}
 
+    def test_from_yaml_reload_does_not_share_parsed_state(self, tmp_path):
+        yaml_file = tmp_path / "config.yaml"
+        yaml_file.write_text("otlp:\n  headers:\n    X-Team: a\n")
+
+        first = BotanuConfig.from_yaml(str(yaml_file))
+        first.otlp_headers["X-Team"] = "mutated"
+        second = BotanuConfig.from_yaml(str(yaml_file))
+        assert second.otlp_headers == {"X-Team": "a"}
+
+    def test_from_yaml_picks_up_file_changes(self, tmp_path):
+        yaml_file = tmp_path / "config.yaml"
+        yaml_file.write_text("service:\n  name: before\n")
+        assert BotanuConfig.from_yaml(str(yaml_file)).service_name == "before"
+
+        yaml_file.write_text("service:\n  name: after\n")
+        assert BotanuConfig.from_yaml(str(yaml_file)).service_name == "after"
+
     def test_from_yaml_file_not_found(self):
         with pytest.raises(FileNotFoundError):
             BotanuConfig.from_yaml("/nonexistent/path/config.yaml")
@@ -165,6 +194,75 @@ service:
         config = BotanuConfig.from_file_or_env(path=str(yaml_file))
         assert config.service_name == "file-service"
 
+    def test_search_result_is_cached(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.delenv("BOTANU_CONFIG_FILE", raising=False)
+        BotanuConfig.invalidate_file_cache()
+        (tmp_path / "botanu.yaml").write_text("service:\n  name: cached-service\n")
+
+        assert BotanuConfig.from_file_or_env().service_name == "cached-service"
+        with mock.patch("botanu.sdk.config.os.path.isfile") as isfile:
+            assert BotanuConfig.from_file_or_env().service_name == "cached-service"
+        isfile.assert_not_called()
+
+    def test_search_stops_at_first_hit(self, tmp_path):
+        yaml_file = tmp_path / "first.yaml"
+        yaml_file.write_text("service:\n  name: first-hit\n")
+        BotanuConfig.invalidate_file_cache()
+
+        with mock.patch("botanu.sdk.config.os.path.isfile", wraps=os.path.isfile) as isfile:
+            assert BotanuConfig.from_file_or_env(path=str(yaml_file)).service_name == "first-hit"
+        isfile.assert_called_once_with(str(yaml_file))
+
+    def test_missing_file_is_not_cached(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.delenv("BOTANU_CONFIG_FILE", raising=False)
+        monkeypatch.setenv("OTEL_SERVICE_NAME", "env-service")
+        BotanuConfig.invalidate_file_cache()
+
+        assert BotanuConfig.from_file_or_env().service_name == "env-service"
+        (tmp_path / "botanu.yaml").write_text("service:\n  name: new-file-service\n")
+        assert BotanuConfig.from_file_or_env().service_name == "new-file-service"
+
+    def test_deleted_cached_file_falls_back_to_env(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.delenv("BOTANU_CONFIG_FILE", raising=False)
+        monkeypatch.setenv("OTEL_SERVICE_NAME", "env-service")
+        BotanuConfig.invalidate_file_cache()
+        yaml_file = tmp_path / "botanu.yaml"
+        yaml_file.write_text("service:\n  name: file-service\n")
+
+        assert BotanuConfig.from_file_or_env().service_name == "file-service"
+        yaml_file.unlink()
+        assert BotanuConfig.from_file_or_env().service_name == "env-service"
+
+    def test_deleted_cached_file_falls_through_to_next_candidate(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.delenv("BOTANU_CONFIG_FILE", raising=False)
+        BotanuConfig.invalidate_file_cache()
+        (tmp_path / "config").mkdir()
+        (tmp_path / "config" / "botanu.yaml").write_text("service:\n  name: nested-service\n")
+        top = tmp_path / "botanu.yaml"
+        top.write_text("service:\n  name: top-service\n")
+
+        assert BotanuConfig.from_file_or_env().service_name == "top-service"
+        top.unlink()
+        assert BotanuConfig.from_file_or_env().service_name == "nested-service"
+
+    def test_invalidate_file_cache_picks_up_higher_priority_file(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.delenv("BOTANU_CONFIG_FILE", raising=False)
+        BotanuConfig.invalidate_file_cache()
+        (tmp_path / "config").mkdir()
+        (tmp_path / "config" / "botanu.yaml").write_text("service:\n  name: nested-service\n")
+
+        assert BotanuConfig.from_file_or_env().service_name == "nested-service"
+        (tmp_path / "botanu.yaml").write_text("service:\n  name: top-service\n")
+        assert BotanuConfig.from_file_or_env().service_name == "nested-service"
+
+        BotanuConfig.invalidate_file_cache()
+        assert BotanuConfig.from_file_or_env().service_name == "top-service"
+
 
 class TestBotanuConfigToDict:
     """Tests for config serialization."""
@@ -194,6 +292,77 @@ class TestBotanuConfigExportTuning:
             assert config.max_export_batch_size == 512
             assert config.export_timeout_millis == 30000
 
+    def test_traces_enabled_by_default(self):
+        with mock.patch.dict(os.environ, {}, clear=True):
+            assert BotanuConfig().traces_enabled is True
+
+    def test_otel_traces_exporter_none_disables_export(self):
+        with mock.patch.dict(os.environ, {"OTEL_TRACES_EXPORTER": "none"}):
+            config = BotanuConfig()
+            assert config.traces_enabled is False
+            assert config.to_dict()["export"]["enabled"] is False
+
+    def test_otel_traces_exporter_otlp_keeps_export(self):
+        with mock.patch.dict(os.environ, {"OTEL_TRACES_EXPORTER": "otlp"}):
+            assert BotanuConfig().traces_enabled is True
+
+    def test_export_profile_fills_defaults(self):
+        with mock.patch.dict(os.environ, {}, clear=True):
+            config = BotanuConfig(export_profile="high_throughput")
+            assert config.max_export_batch_size == 256
+            assert config.schedule_delay_millis == 1000
+            assert config.export_timeout_millis == 10000
+            assert config.max_queue_size == 65536
+
+    def test_export_profile_explicit_and_env_values_win(self):
+        with mock.patch.dict(os.environ, {"BOTANU_EXPORT_TIMEOUT_MILLIS": "20000"}, clear=True):
+            config = BotanuConfig(export_profile="low_latency", schedule_delay_millis=750)
+            assert config.max_export_batch_size == 128
+            assert config.schedule_delay_millis == 750
+            assert config.export_timeout_millis == 20000
+
+    def test_export_profile_keeps_explicit_values_equal_to_default(self):
+        with mock.patch.dict(os.environ, {}, clear=True):
+            config = BotanuConfig(
+                export_profile="low_latency",
+                max_export_batch_size=512,
+                schedule_delay_millis=5000,
+                export_timeout_millis=30000,
+            )
+            assert config.max_export_batch_size == 512
+            assert config.schedule_delay_millis == 5000
+            assert config.export_timeout_millis == 30000
+
+    def test_export_profile_keeps_env_values_equal_to_default(self):
+        env = {
+            "BOTANU_EXPORT_PROFILE": "low_latency",
+            "BOTANU_MAX_EXPORT_BATCH_SIZE": "512",
+            "BOTANU_EXPORT_TIMEOUT_MILLIS": "30000",
+        }
+        with mock.patch.dict(os.environ, env, clear=True):
+            config = BotanuConfig()
+            assert config.max_export_batch_size == 512
+            assert config.export_timeout_millis == 30000
+            assert config.schedule_delay_millis == 200
+
+    def test_export_profile_from_yaml_keeps_explicit_default_values(self):
+        with mock.patch.dict(os.environ, {}, clear=True):
+            config = BotanuConfig._from_dict({"export": {"profile": "high_throughput", "batch_size": 512}})
+            assert config.max_export_batch_size == 512
+            assert config.schedule_delay_millis == 1000
+
+    def test_export_profile_from_env(self):
+        with mock.patch.dict(os.environ, {"BOTANU_EXPORT_PROFILE": "low_latency"}, clear=True):
+            config = BotanuConfig()
+            assert config.export_profile == "low_latency"
+            assert config.schedule_delay_millis == 200
+
+    def test_unknown_export_profile_falls_back_to_default(self):
+        with mock.patch.dict(os.environ, {}, clear=True):
+            config = BotanuConfig(export_profile="turbo")
+            assert config.export_profile == "default"
+            assert config.schedule_delay_millis == 5000
+
     def test_env_var_max_queue_size(self):
         with mock.patch.dict(os.environ, {"BOTANU_MAX_QUEUE_SIZE": "131072"}):
             config = BotanuConfig()
@@ -519,10 +688,15 @@ class TestPIIScrubConfig:
             assert config.pii_scrub_enabled is False
 
     def test_env_var_enabled_variants(self):
-        for value in ("true", "1", "yes"):
+        for value in ("true", "1", "yes", "on", "TRUE", " Yes "):
             with mock.patch.dict(os.environ, {"BOTANU_PII_SCRUB_ENABLED": value}):
                 assert BotanuConfig().pii_scrub_enabled is True
 
+    def test_env_var_unrecognised_value_is_false(self):
+        for value in ("false", "0", "no", "off", ""):
+            with mock.patch.dict(os.environ, {"BOTANU_PII_SCRUB_ENABLED": value}):
+                assert BotanuConfig().pii_scrub_enabled is False
+
     def test_env_var_unset_keeps_default_on(self):
         with mock.patch.dict(os.environ, {}, clear=True):
             os.environ.pop("BOTANU_PII_SCRUB_ENABLED", None)
@@ -5,10 +5,15 @@
 
 from __future__ import annotations
 
+from unittest import mock
+
+import pytest
 from opentelemetry import trace
 
 from botanu.sdk.context import (
+    baggage_scope,
     get_baggage,
+    get_baggage_bulk,
     get_current_span,
     get_run_id,
     get_workflow,
@@ -49,6 +54,47 @@ class TestBaggageHelpers:
         result = get_workflow()
         assert result is None or isinstance(result, str)
 
+    def test_baggage_scope_sets_and_restores(self):
+        with baggage_scope({"scope.a": "1", "scope.b": "2"}):
+            assert get_baggage("scope.a") == "1"
+            assert get_baggage("scope.b") == "2"
+        assert get_baggage("scope.a") is None
+        assert get_baggage("scope.b") is None
+
+    def test_baggage_scope_detaches_on_error(self):
+        with pytest.raises(RuntimeError), baggage_scope({"scope.err": "x"}):
+            raise RuntimeError("boom")
+        assert get_baggage("scope.err") is None
+
+    def test_baggage_scope_keeps_existing_entries(self):
+        set_baggage("scope.outer", "kept")
+        with baggage_scope({"scope.inner": "added", "scope.outer": "shadowed"}):
+            assert get_baggage_bulk(["scope.outer", "scope.inner"]) == {
+                "scope.outer": "shadowed",
+                "scope.inner": "added",
+            }
+        assert get_baggage("scope.outer") == "kept"
+        assert get_baggage("scope.inner") is None
+
+    def test_baggage_scope_without_private_baggage_key(self):
+        set_baggage("scope.outer", "kept")
+        with mock.patch("botanu.sdk.context._BAGGAGE_KEY", None), baggage_scope({"scope.a": "1", "scope.b": "2"}):
+            assert get_baggage_bulk(["scope.outer", "scope.a", "scope.b"]) == {
+                "scope.outer": "kept",
+                "scope.a": "1",
+                "scope.b": "2",
+            }
+        assert get_baggage("scope.a") is None
+
+    def test_get_baggage_bulk(self):
+        set_baggage("bulk.first", "one")
+        set_baggage("bulk.second", "two")
+        assert get_baggage_bulk(["bulk.first", "bulk.second", "bulk.missing"]) == {
+            "bulk.first": "one",
+            "bulk.second": "two",
+            "bulk.missing": None,
+        }
+
 
 class TestSpanHelpers:
     """Tests for span helper functions."""
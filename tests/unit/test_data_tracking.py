@@ -5,6 +5,9 @@
 
 from __future__ import annotations
 
+import sys
+from unittest.mock import MagicMock
+
 import pytest
 
 from botanu.tracking.data import (
@@ -252,6 +255,40 @@ class TestSystemNormalization:
         attrs = dict(spans[0].attributes)
         assert attrs["db.system"] == "cockroachdb"
 
+    def test_span_names_and_keys_are_memoised(self):
+        from botanu.tracking.data import _attr_key, _span_name
+
+        assert _span_name("db", "postgresql", "SELECT") == "db.postgresql.select"
+        assert _span_name("db", "postgresql", "SELECT") is _span_name("db", "postgresql", "SELECT")
+        assert _attr_key("botanu.data", "shard") is _attr_key("botanu.data", "shard")
+
+    def test_spans_use_module_tracers(self, memory_exporter):
+        with track_db_operation(system="postgresql", operation="SELECT"):
+            pass
+        with track_storage_operation(system="s3", operation="GET"):
+            pass
+        with track_messaging_operation(system="sqs", operation="publish", destination="q"):
+            pass
+
+        scopes = [s.instrumentation_scope.name for s in memory_exporter.get_finished_spans()]
+        assert scopes == ["botanu.data", "botanu.storage", "botanu.messaging"]
+
+    def test_canonical_names_map_to_themselves(self):
+        from botanu.tracking.data import DB_SYSTEMS, MESSAGING_SYSTEMS, STORAGE_SYSTEMS, _normalize_system
+
+        for table in (DB_SYSTEMS, STORAGE_SYSTEMS, MESSAGING_SYSTEMS):
+            canonical = frozenset(table.values())
+            for name in canonical:
+                assert table[name] == name
+                assert _normalize_system(name, table, canonical) == name
+
+    def test_mixed_case_alias_still_normalized(self, memory_exporter):
+        with track_storage_operation(system="AWS_S3", operation="GET"):
+            pass
+
+        attrs = dict(memory_exporter.get_finished_spans()[0].attributes)
+        assert attrs["botanu.storage.system"] == "s3"
+
 
 class TestDBTrackerMetadata:
     """Tests for DBTracker.add_metadata and set_bytes_scanned."""
@@ -291,6 +328,42 @@ class TestDBTrackerMetadata:
         assert "botanu.data.duration_ms" in attrs
         assert attrs["botanu.data.duration_ms"] >= 0
 
+    @pytest.mark.skipif(sys.version_info < (3, 10), reason="dataclass slots require Python 3.10+")
+    def test_trackers_use_slots_layout(self):
+        from botanu.tracking.data import DBTracker, MessagingTracker, StorageTracker
+
+        trackers = (
+            DBTracker(system="postgresql", operation="SELECT"),
+            StorageTracker(system="s3", operation="GET"),
+            MessagingTracker(system="sqs", operation="publish", destination="q"),
+        )
+        for tracker in trackers:
+            assert not hasattr(tracker, "__dict__")
+
+    def test_set_result_and_metadata_write_in_one_call_each(self):
+        from botanu.tracking.data import DBTracker
+
+        span = MagicMock()
+        tracker = DBTracker(system="postgresql", operation="SELECT", span=span)
+        tracker.set_result(rows_returned=3, bytes_read=10)
+        tracker.add_metadata(shard="a", **{"botanu.custom": 1})
+
+        assert span.set_attributes.call_args_list == [
+            (({"botanu.data.rows_returned": 3, "botanu.data.bytes_read": 10},),),
+            (({"botanu.data.shard": "a", "botanu.custom": 1},),),
+        ]
+        span.set_attribute.assert_not_called()
+
+    def test_duration_uses_perf_counter(self, memory_exporter, monkeypatch):
+        from botanu.tracking import data
+
+        span = MagicMock()
+        tracker = data.DBTracker(system="postgresql", operation="SELECT", span=span, start_ns=1_000_000_000)
+        monkeypatch.setattr(data.time, "perf_counter_ns", lambda: 1_250_000_000)
+        tracker._finalize()
+
+        span.set_attribute.assert_called_once_with("botanu.data.duration_ms", 250.0)
+
 
 class TestStorageTrackerMetadata:
     """Tests for StorageTracker.add_metadata."""
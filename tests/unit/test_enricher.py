@@ -45,6 +45,25 @@ class TestRunContextEnricher:
         assert attrs.get("botanu.environment") == "staging"
         assert attrs.get("botanu.tenant_id") == "tenant-789"
 
+    def test_on_start_public_api_fallback(self, memory_exporter):
+        """Without the private baggage key, on_start falls back to get_all()."""
+        enricher = RunContextEnricher()
+
+        ctx = context.Context()
+        ctx = baggage.set_baggage("botanu.run_id", "run-fallback", context=ctx)
+
+        tracer = trace.get_tracer("test")
+        token = context.attach(ctx)
+        try:
+            with mock.patch("botanu.processors.enricher._BAGGAGE_KEY", None):
+                with tracer.start_as_current_span("test-span") as span:
+                    enricher.on_start(span, ctx)
+        finally:
+            context.detach(token)
+
+        spans = memory_exporter.get_finished_spans()
+        assert spans[0].attributes.get("botanu.run_id") == "run-fallback"
+
     def test_on_start_missing_baggage(self, memory_exporter):
         """Should handle missing baggage gracefully."""
         enricher = RunContextEnricher()
@@ -66,6 +85,31 @@ class TestRunContextEnricher:
         # No botanu attributes should be set
         assert "botanu.run_id" not in attrs
 
+    def test_on_start_without_baggage_skips_span_access(self):
+        """Spans outside any botanu scope should not be touched at all."""
+        enricher = RunContextEnricher()
+        span = mock.MagicMock()
+        clean_ctx = context.Context()
+
+        token = context.attach(clean_ctx)
+        try:
+            enricher.on_start(span, clean_ctx)
+        finally:
+            context.detach(token)
+
+        span.set_attribute.assert_not_called()
+
+    def test_on_start_skips_non_recording_span(self):
+        """Sampled-out spans are left untouched even when baggage is present."""
+        enricher = RunContextEnricher()
+        span = mock.MagicMock()
+        span.is_recording.return_value = False
+        ctx = baggage.set_baggage("botanu.run_id", "run-123", context=context.Context())
+
+        enricher.on_start(span, ctx)
+
+        span.set_attribute.assert_not_called()
+
     def test_on_start_does_not_override_existing(self, memory_exporter):
         """Should not override existing span attributes."""
         enricher = RunContextEnricher()
@@ -127,3 +171,12 @@ class TestRunContextEnricher:
         assert "botanu.tenant_id" in RunContextEnricher.BAGGAGE_KEYS
         assert "botanu.parent_run_id" in RunContextEnricher.BAGGAGE_KEYS
         assert len(RunContextEnricher.BAGGAGE_KEYS) == 7
+
+    def test_baggage_keys_shared_with_run_context(self):
+        """Keys written by RunContext are the same objects the enricher looks up."""
+        from botanu.models.run_context import RunContext
+
+        ctx = RunContext.create(workflow="wf", event_id="evt", customer_id="cust")
+        written = list(ctx.to_baggage_dict())
+        for key in RunContextEnricher.BAGGAGE_KEYS[:5]:
+            assert any(key is k for k in written)
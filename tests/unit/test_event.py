@@ -10,6 +10,8 @@ span attributes, same baggage, same run.started/run.completed events.
 
 from __future__ import annotations
 
+import inspect
+
 import pytest
 from opentelemetry import baggage as otel_baggage
 from opentelemetry import context as otel_context
@@ -69,6 +71,14 @@ class TestEventContextManager:
         assert completed.attributes["status"] == "failure"
         assert completed.attributes["error_class"] == "ValueError"
 
+    def test_nested_event_records_parent_run_id(self, memory_exporter):
+        with botanu.event(event_id="outer", customer_id="c", workflow="Outer") as outer:
+            with botanu.event(event_id="inner", customer_id="c", workflow="Inner") as inner:
+                pass
+
+        assert inner.parent_run_id == outer.run_id
+        assert outer.parent_run_id is None
+
     def test_sync_cm_sets_baggage_for_downstream_spans(self, memory_exporter):
         with botanu.event(event_id="e", customer_id="c", workflow="W"):
             ctx = get_current()
@@ -153,6 +163,17 @@ class TestEventDecorator:
         assert attrs["botanu.event_id"] == "T-99"
         assert attrs["botanu.customer_id"] == "user-7"
 
+    def test_decorator_mixes_static_and_callable_ids(self, memory_exporter):
+        @botanu.event(workflow="Support", event_id=lambda tid: tid, customer_id="acme")
+        def handle(tid):
+            return tid
+
+        handle("T-1")
+        handle("T-2")
+        spans = memory_exporter.get_finished_spans()
+        assert [s.attributes["botanu.event_id"] for s in spans] == ["T-1", "T-2"]
+        assert {s.attributes["botanu.customer_id"] for s in spans} == {"acme"}
+
     @pytest.mark.asyncio
     async def test_async_decorator_creates_span(self, memory_exporter):
         @botanu.event(event_id="e", customer_id="c", workflow="AsyncDec")
@@ -163,6 +184,29 @@ class TestEventDecorator:
         spans = memory_exporter.get_finished_spans()
         assert spans[0].name == "botanu.run/AsyncDec"
 
+    @pytest.mark.asyncio
+    async def test_async_callable_object_decorated_as_async(self, memory_exporter):
+        class Handler:
+            async def __call__(self):
+                return "obj"
+
+        fn = botanu.event(event_id="e", customer_id="c", workflow="AsyncObj")(Handler())
+        assert inspect.iscoroutinefunction(fn)
+        assert await fn() == "obj"
+        assert memory_exporter.get_finished_spans()[0].name == "botanu.run/AsyncObj"
+
+    def test_compiled_coroutine_marker_detected(self):
+        import asyncio.coroutines
+
+        from botanu.sdk.decorators import _is_async_callable
+
+        def compiled():  # stands in for a Cython coroutine function
+            pass
+
+        compiled._is_coroutine = asyncio.coroutines._is_coroutine
+        assert _is_async_callable(compiled)
+        assert not _is_async_callable(lambda: None)
+
     def test_decorator_records_exception(self, memory_exporter):
         @botanu.event(event_id="e", customer_id="c", workflow="W")
         def bad():
@@ -184,6 +228,130 @@ class TestEventDecorator:
         assert my_function.__name__ == "my_function"
         assert my_function.__doc__ == "docstring"
 
+    def test_decorator_copies_full_wrapper_metadata(self, memory_exporter):
+        def target(x: int) -> int:
+            return x
+
+        target.marker = "kept"
+        wrapped = botanu.event(event_id="e", customer_id="c", workflow="W")(target)
+
+        assert wrapped.__wrapped__ is target
+        assert wrapped.__qualname__ == target.__qualname__
+        assert wrapped.__module__ == target.__module__
+        assert wrapped.__annotations__ == target.__annotations__
+        assert wrapped.marker == "kept"
+
+    def test_decorator_wraps_callable_without_name(self, memory_exporter):
+        import functools
+
+        def target(x, y):
+            return x + y
+
+        wrapped = botanu.event(event_id="e", customer_id="c", workflow="W")(functools.partial(target, 1))
+
+        assert wrapped(2) == 3
+        assert wrapped.__wrapped__.func is target
+
+    def test_workflow_version_computed_on_first_call_only(self, memory_exporter, monkeypatch):
+        from botanu.sdk import decorators
+
+        calls = []
+        monkeypatch.setattr(decorators, "_compute_workflow_version", lambda func: calls.append(func) or "v:test")
+
+        @botanu.event(event_id="e", customer_id="c", workflow="Lazy")
+        def fn():
+            return None
+
+        assert calls == []
+        fn()
+        fn()
+        assert len(calls) == 1
+        spans = memory_exporter.get_finished_spans()
+        assert all(s.attributes["botanu.workflow.version"] == "v:test" for s in spans)
+
+    def test_decorator_reuses_run_factory_across_calls(self, memory_exporter, monkeypatch):
+        from botanu.models import run_context
+
+        @botanu.event(event_id="e", customer_id="c", workflow="Reuse")
+        def fn():
+            return None
+
+        monkeypatch.setenv("BOTANU_ENVIRONMENT", "staging")
+        calls = []
+        real_default = run_context._default_environment
+        monkeypatch.setattr(run_context, "_default_environment", lambda: calls.append(1) or real_default())
+        fn()
+        fn()
+
+        assert len(calls) == 1
+        spans = memory_exporter.get_finished_spans()
+        assert [s.attributes["botanu.environment"] for s in spans] == ["staging", "staging"]
+        assert spans[0].attributes["botanu.run_id"] != spans[1].attributes["botanu.run_id"]
+
+    def test_emit_events_false_skips_run_events(self, memory_exporter):
+        @botanu.event(event_id="e", customer_id="c", workflow="Quiet", emit_events=False)
+        def fn():
+            return None
+
+        fn()
+        span = memory_exporter.get_finished_spans()[0]
+        assert span.events == ()
+        assert span.attributes["botanu.workflow"] == "Quiet"
+        assert "botanu.run.duration_ms" in span.attributes
+
+    def test_emit_events_default_follows_env(self, memory_exporter, monkeypatch):
+        monkeypatch.setenv("BOTANU_EMIT_EVENTS", "false")
+        with botanu.event(event_id="e", customer_id="c", workflow="Quiet"):
+            pass
+        with botanu.event(event_id="e", customer_id="c", workflow="Loud", emit_events=True):
+            pass
+
+        quiet, loud = memory_exporter.get_finished_spans()
+        assert quiet.events == ()
+        assert [e.name for e in loud.events] == ["botanu.run.started", "botanu.run.completed"]
+
+    @pytest.mark.parametrize(("value", "expected"), [(" ON ", True), ("0", False), ("garbage", False)])
+    def test_emit_events_env_parsed_like_other_bool_vars(self, memory_exporter, monkeypatch, value, expected):
+        monkeypatch.setenv("BOTANU_EMIT_EVENTS", value)
+        with botanu.event(event_id="e", customer_id="c", workflow="Env"):
+            pass
+
+        assert bool(memory_exporter.get_finished_spans()[0].events) is expected
+
+    def test_sampled_capture_follows_config_rate(self, memory_exporter, monkeypatch):
+        from botanu.sdk import bootstrap
+        from botanu.sdk.config import BotanuConfig
+
+        @botanu.event(event_id="e", customer_id="c", workflow="Capture")
+        def fn(x):
+            return x * 2
+
+        monkeypatch.setattr(bootstrap, "_current_config", BotanuConfig(content_capture_rate=1.0))
+        fn(2)
+        monkeypatch.setattr(bootstrap, "_current_config", BotanuConfig(content_capture_rate=0.0))
+        fn(3)
+
+        captured, skipped = memory_exporter.get_finished_spans()
+        assert captured.attributes["botanu.eval.input_content"] == '{"x": 2}'
+        assert captured.attributes["botanu.eval.output_content"] == "4"
+        assert "botanu.eval.input_content" not in skipped.attributes
+
+    def test_non_recording_span_skips_enrichment_but_keeps_baggage(self, memory_exporter, monkeypatch):
+        from botanu.models.run_context import RunContext
+        from botanu.sdk import decorators
+
+        monkeypatch.setattr(decorators, "tracer", trace.NoOpTracer())
+        monkeypatch.setattr(
+            RunContext, "to_span_attributes", lambda self: pytest.fail("attributes built for no-op span"),
+        )
+
+        @botanu.event(event_id="e", customer_id="c", workflow="NoOp")
+        def fn():
+            return otel_baggage.get_baggage("botanu.workflow")
+
+        assert fn() == "NoOp"
+        assert memory_exporter.get_finished_spans() == ()
+
 
 # ── Capture parity: CM form should match decorator form ──────────────────
 
@@ -695,3 +695,26 @@ class TestContentCapturePIIScrubbing:
 
         attrs = dict(memory_exporter.get_finished_spans()[0].attributes)
         assert "alice@example.com" not in attrs["botanu.eval.input_content"]
+
+
+class TestTenacityIntegration:
+    """Tests for the tenacity retry hooks feeding track_llm_call."""
+
+    def test_attempt_stamped_inside_retry_loop(self, memory_exporter):
+        from types import SimpleNamespace
+
+        from botanu.integrations.tenacity import botanu_after_all, botanu_before
+
+        botanu_before(SimpleNamespace(attempt_number=2))
+        try:
+            with track_llm_call(model="gpt-4", vendor="openai"):
+                pass
+        finally:
+            botanu_after_all(SimpleNamespace(attempt_number=2))
+
+        with track_llm_call(model="gpt-4", vendor="openai"):
+            pass
+
+        retried, plain = memory_exporter.get_finished_spans()
+        assert retried.attributes.get("botanu.request.attempt") == 2
+        assert "botanu.request.attempt" not in plain.attributes
@@ -5,6 +5,8 @@
 
 from __future__ import annotations
 
+import os
+
 import pytest
 from opentelemetry import context as otel_context
 from starlette.applications import Starlette
@@ -83,6 +85,129 @@ class TestBotanuMiddleware:
         run_id2 = resp2.headers.get("x-botanu-run-id")
         assert run_id1 != run_id2
 
+    def test_generated_run_id_is_uuid4(self, memory_exporter):
+        import uuid
+
+        client = TestClient(_make_app())
+        run_id = client.get("/").headers["x-botanu-run-id"]
+        assert uuid.UUID(run_id).version == 4
+
+    def test_handler_sees_request_baggage(self, memory_exporter):
+        client = TestClient(_make_baggage_check_app())
+        resp = client.get("/check", headers={"x-botanu-run-id": "seen-001"})
+        assert resp.json() == {"run_id": "seen-001"}
+
+    def test_handler_headers_overwritten_not_duplicated(self, memory_exporter):
+        async def homepage(request):
+            return JSONResponse({"ok": True}, headers={"x-botanu-workflow": "from_handler"})
+
+        app = Starlette(routes=[Route("/", homepage)])
+        app.add_middleware(BotanuMiddleware, workflow="mw")
+        resp = TestClient(app).get("/")
+        assert resp.headers.get_list("x-botanu-workflow") == ["mw"]
+
+    @pytest.mark.asyncio
+    async def test_non_http_scope_passes_through(self):
+        seen = []
+
+        async def inner(scope, receive, send):
+            seen.append(scope["type"])
+
+        mw = BotanuMiddleware(inner, workflow="wf")
+        await mw({"type": "lifespan"}, None, None)
+        assert seen == ["lifespan"]
+
+    @pytest.mark.asyncio
+    async def test_reads_raw_scope_headers(self):
+        from opentelemetry import baggage as otel_baggage
+
+        seen = {}
+
+        async def inner(scope, receive, send):
+            seen.update(otel_baggage.get_all())
+
+        mw = BotanuMiddleware(inner, workflow="wf")
+        scope = {
+            "type": "http",
+            "method": "GET",
+            "path": "/",
+            "headers": [(b"x-botanu-run-id", b"raw-1"), (b"x-botanu-customer-id", b"cust-\xe9")],
+        }
+        await mw(scope, None, None)
+        assert seen == {"botanu.run_id": "raw-1", "botanu.workflow": "wf", "botanu.customer_id": "cust-\u00e9"}
+
+    @pytest.mark.asyncio
+    async def test_stamps_server_span_attributes(self, memory_exporter):
+        from opentelemetry import trace
+
+        async def inner(scope, receive, send):
+            pass
+
+        mw = BotanuMiddleware(inner, workflow="wf")
+        scope = {
+            "type": "http",
+            "method": "POST",
+            "path": "/tickets",
+            "root_path": "/api",
+            "headers": [(b"x-botanu-run-id", b"run-9"), (b"x-botanu-customer-id", b"cust-9")],
+        }
+        with trace.get_tracer("test").start_as_current_span("server"):
+            await mw(scope, None, None)
+
+        attrs = dict(memory_exporter.get_finished_spans()[0].attributes)
+        assert attrs == {
+            "botanu.run_id": "run-9",
+            "botanu.workflow": "wf",
+            "botanu.customer_id": "cust-9",
+            "http.route": "/api/tickets",
+            "http.method": "POST",
+        }
+
+
+class TestRunIdPool:
+    """Tests for the prefetched run-id entropy pool."""
+
+    @pytest.mark.skipif(not hasattr(os, "fork"), reason="requires os.fork")
+    def test_forked_child_does_not_reuse_pooled_ids(self):
+        from botanu.sdk import middleware
+
+        middleware._next_run_id()  # leave IDs pooled in the parent
+        read_fd, write_fd = os.pipe()
+        pid = os.fork()
+        if pid == 0:  # pragma: no cover - runs in the child
+            os.close(read_fd)
+            os.write(write_fd, middleware._next_run_id().encode())
+            os._exit(0)
+        os.close(write_fd)
+        os.waitpid(pid, 0)
+        with os.fdopen(read_fd, "rb") as pipe:
+            child_id = pipe.read().decode()
+
+        assert child_id
+        assert child_id != middleware._next_run_id()
+
+    def test_pool_refills_with_single_urandom_read(self, monkeypatch):
+        import uuid
+
+        from botanu.sdk import middleware
+
+        reads = []
+        real_urandom = middleware.os.urandom
+        monkeypatch.setattr(middleware, "_run_id_pool", [])
+        monkeypatch.setattr(middleware.os, "urandom", lambda n: reads.append(n) or real_urandom(n))
+
+        ids = {middleware._next_run_id() for _ in range(middleware._RUN_ID_POOL_SIZE)}
+
+        assert reads == [16 * middleware._RUN_ID_POOL_SIZE]
+        assert len(ids) == middleware._RUN_ID_POOL_SIZE
+        for run_id in ids:
+            parsed = uuid.UUID(run_id)
+            assert str(parsed) == run_id
+            assert parsed.version == 4
+            assert parsed.variant == uuid.RFC_4122
+        middleware._next_run_id()
+        assert len(reads) == 2
+
 
 class TestMiddlewareBaggageIsolation:
     """Tests for baggage context isolation between requests."""
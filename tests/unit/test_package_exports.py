@@ -0,0 +1,59 @@
+# SPDX-FileCopyrightText: 2026 The Botanu Authors
+# SPDX-License-Identifier: Apache-2.0
+
+"""Tests for the top-level ``botanu`` package exports."""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+
+import pytest
+
+import botanu
+
+
+class TestPackageExports:
+    """Tests for lazy (PEP 562) re-exports in ``botanu/__init__.py``."""
+
+    def test_all_names_resolve(self):
+        for name in botanu.__all__:
+            assert getattr(botanu, name) is not None
+
+    def test_lazy_names_match_source_modules(self):
+        from botanu.sdk.bootstrap import enable
+        from botanu.sdk.decorators import event
+
+        assert botanu.enable is enable
+        assert botanu.event is event
+
+    def test_unknown_attribute_raises(self):
+        with pytest.raises(AttributeError):
+            botanu.does_not_exist  # noqa: B018
+
+    def test_import_does_not_load_bootstrap(self):
+        code = (
+            "import sys, botanu; "
+            "assert 'botanu.sdk.bootstrap' not in sys.modules; "
+            "assert 'opentelemetry.sdk.trace' not in sys.modules"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True)  # noqa: S603
+
+    def test_version_resolved_lazily(self):
+        code = (
+            "import botanu, botanu._version as v; "
+            "assert '__version__' not in vars(v); "
+            "assert isinstance(botanu.__version__, str); "
+            "assert vars(v)['__version__'] == botanu.__version__"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True)  # noqa: S603
+
+    def test_sdk_submodule_import_does_not_load_bootstrap(self):
+        code = (
+            "import sys, botanu.sdk.decorators; "
+            "assert 'botanu.sdk.bootstrap' not in sys.modules; "
+            "assert 'botanu.sdk.config' not in sys.modules; "
+            "from botanu.sdk import enable; "
+            "assert 'botanu.sdk.bootstrap' in sys.modules"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True)  # noqa: S603
@@ -52,6 +52,12 @@ class TestCloudProviderInference:
     def test_azure_namespace_attr_infers_azure(self):
         assert _infer_cloud_provider({"azure.namespace": "Microsoft.Storage"}) == "azure"
 
+    def test_bounded_attributes_mapping(self):
+        from opentelemetry.attributes import BoundedAttributes
+
+        attrs = BoundedAttributes(attributes={"http.method": "GET", "aws.region": "us-east-1"}, immutable=True)
+        assert _infer_cloud_provider(attrs) == "aws"
+
     def test_db_system_dynamodb_infers_aws(self):
         assert _infer_cloud_provider({"db.system": "dynamodb"}) == "aws"
 
@@ -0,0 +1,95 @@
+# SPDX-FileCopyrightText: 2026 The Botanu Authors
+# SPDX-License-Identifier: Apache-2.0
+
+"""Tests for resource detection helpers."""
+
+from __future__ import annotations
+
+from unittest import mock
+
+import pytest
+
+from botanu import resources
+
+
+@pytest.fixture(autouse=True)
+def _clear_detector_cache():
+    resources._invalidate_detector_cache()
+    yield
+    resources._invalidate_detector_cache()
+
+
+def _detector(attrs: dict) -> mock.MagicMock:
+    detector = mock.MagicMock()
+    detector.detect.return_value.attributes = attrs
+    return detector
+
+
+class TestDetectResourceAttrs:
+    """Tests for detect_resource_attrs caching."""
+
+    def test_detectors_run_once_per_process(self):
+        detector = _detector({"cloud.provider": "aws"})
+        with mock.patch.object(resources, "collect_detectors", return_value=[detector]):
+            assert resources.detect_resource_attrs() == {"cloud.provider": "aws"}
+            assert resources.detect_resource_attrs() == {"cloud.provider": "aws"}
+        detector.detect.assert_called_once()
+
+    def test_returns_independent_copies(self):
+        with mock.patch.object(resources, "collect_detectors", return_value=[_detector({"host.name": "a"})]):
+            first = resources.detect_resource_attrs()
+            first["host.name"] = "mutated"
+            assert resources.detect_resource_attrs() == {"host.name": "a"}
+
+    def test_cached_view_is_read_only(self):
+        with mock.patch.object(resources, "collect_detectors", return_value=[_detector({"host.name": "a"})]):
+            view = resources._cached_resource_attrs()
+        with pytest.raises(TypeError):
+            view["host.name"] = "mutated"  # type: ignore[index]
+
+    def test_redetects_after_fork(self):
+        detector = _detector({"process.pid": 1})
+        with mock.patch.object(resources, "collect_detectors", return_value=[detector]):
+            with mock.patch("os.getpid", return_value=100):
+                resources.detect_resource_attrs()
+            with mock.patch("os.getpid", return_value=200):
+                resources.detect_resource_attrs()
+        assert detector.detect.call_count == 2
+
+    def test_failing_detector_is_skipped(self):
+        broken = mock.MagicMock()
+        broken.detect.side_effect = RuntimeError("metadata endpoint timeout")
+        with mock.patch.object(resources, "collect_detectors", return_value=[broken, _detector({"k": "v"})]):
+            assert resources.detect_resource_attrs() == {"k": "v"}
+
+
+class TestCollectDetectors:
+    """Tests for metadata-endpoint detector gating."""
+
+    def test_disable_imds_skips_metadata_detectors(self):
+        with mock.patch.dict("os.environ", {"BOTANU_DISABLE_IMDS": "true"}):
+            skipped = resources._skipped_detectors()
+        assert skipped == {"AwsEc2ResourceDetector", "GoogleCloudResourceDetector", "AzureVMResourceDetector"}
+
+    @pytest.mark.parametrize("value", ["on", " TRUE ", "y"])
+    def test_disable_imds_parsed_like_other_bool_vars(self, value):
+        with mock.patch.dict("os.environ", {"BOTANU_DISABLE_IMDS": value}, clear=True):
+            assert resources._skipped_detectors() == resources._METADATA_ENDPOINT_DETECTORS
+
+    def test_disable_imds_false_value_keeps_detectors(self):
+        with mock.patch.dict("os.environ", {"BOTANU_DISABLE_IMDS": "off"}, clear=True):
+            assert resources._skipped_detectors() == frozenset()
+
+    def test_ec2_probe_skipped_on_ecs(self):
+        env = {"ECS_CONTAINER_METADATA_URI_V4": "http://169.254.170.2/v4/abc"}
+        with mock.patch.dict("os.environ", env, clear=True):
+            assert resources._skipped_detectors() == {"AwsEc2ResourceDetector"}
+
+    def test_metadata_detectors_enabled_by_default(self):
+        with mock.patch.dict("os.environ", {}, clear=True):
+            assert resources._skipped_detectors() == frozenset()
+
+    def test_skipped_detectors_not_instantiated(self):
+        with mock.patch.dict("os.environ", {"BOTANU_DISABLE_IMDS": "1"}):
+            names = {type(d).__name__ for d in resources.collect_detectors()}
+        assert names.isdisjoint(resources._METADATA_ENDPOINT_DETECTORS)
@@ -7,12 +7,16 @@ from __future__ import annotations
 
 import os
 import re
+import sys
 import time
 from unittest import mock
 
+import pytest
+
 from botanu.models.run_context import (
     RunContext,
     RunStatus,
+    _assemble_uuidv7,
     generate_run_id,
 )
 
@@ -31,6 +35,19 @@ class TestGenerateRunId:
         ids = [generate_run_id() for _ in range(1000)]
         assert len(set(ids)) == 1000
 
+    def test_embeds_millisecond_timestamp(self):
+        """First 48 bits should be the Unix timestamp in milliseconds."""
+        before = time.time_ns() // 1_000_000
+        run_id = generate_run_id()
+        after = time.time_ns() // 1_000_000
+        embedded = int(run_id.replace("-", "")[:12], 16)
+        assert before <= embedded <= after
+
+    def test_assemble_sets_version_and_variant_bits(self):
+        """All-ones random input must still yield version 7 / RFC 4122 variant."""
+        run_id = _assemble_uuidv7(0x0123456789AB, b"\xff" * 10)
+        assert run_id == "01234567-89ab-7fff-bfff-ffffffffffff"
+
     def test_sortable_by_time(self):
         """IDs generated later should sort after earlier ones."""
         id1 = generate_run_id()
@@ -69,6 +86,59 @@ class TestRunContextCreate:
             ctx = RunContext.create(workflow="test", event_id="evt-1", customer_id="cust-1", environment="production")
             assert ctx.environment == "production"
 
+    @pytest.mark.skipif(sys.version_info < (3, 10), reason="dataclass slots require Python 3.10+")
+    def test_uses_slots_layout(self):
+        ctx = RunContext.create(workflow="test", event_id="evt-1", customer_id="cust-1")
+        assert not hasattr(ctx, "__dict__")
+        assert ctx.root_run_id == ctx.run_id
+
+    def test_start_time_derived_from_ns(self):
+        ctx = RunContext(
+            run_id="r",
+            workflow="w",
+            event_id="e",
+            customer_id="c",
+            environment="test",
+            start_time_ns=1_700_000_000_123_456_789,
+        )
+        assert ctx.start_time.isoformat() == "2023-11-14T22:13:20.123456+00:00"
+        assert ctx.to_span_attributes()["botanu.run.start_time"] == "2023-11-14T22:13:20.123456+00:00"
+
+
+class TestRunContextFactory:
+    """Tests for RunContext.factory."""
+
+    def test_factory_fixes_per_service_fields(self):
+        make = RunContext.factory(workflow="Support", workflow_version="v2", environment="staging", tenant_id="t-1")
+        ctx = make("evt-1", "cust-1")
+
+        assert ctx.workflow == "Support"
+        assert ctx.workflow_version == "v2"
+        assert ctx.environment == "staging"
+        assert ctx.tenant_id == "t-1"
+        assert ctx.event_id == "evt-1"
+        assert ctx.customer_id == "cust-1"
+        assert ctx.root_run_id == ctx.run_id
+        assert ctx.attempt == 1
+        assert ctx.deadline is None
+
+    def test_factory_generates_fresh_run_ids(self):
+        make = RunContext.factory(workflow="Support")
+        assert make("evt-1", "cust-1").run_id != make("evt-1", "cust-1").run_id
+
+    def test_factory_resolves_environment_once(self):
+        with mock.patch.dict(os.environ, {"BOTANU_ENVIRONMENT": "staging"}):
+            make = RunContext.factory(workflow="Support")
+        with mock.patch.dict(os.environ, {"BOTANU_ENVIRONMENT": "qa"}):
+            assert make("evt-1", "cust-1").environment == "staging"
+
+    def test_factory_per_run_options(self):
+        make = RunContext.factory(workflow="Support")
+        ctx = make("evt-1", "cust-1", parent_run_id="parent-1", deadline_seconds=10.0)
+        assert ctx.parent_run_id == "parent-1"
+        assert ctx.deadline is not None
+        assert ctx.deadline > time.time()
+
 
 class TestRunContextRetry:
     """Tests for retry handling."""
@@ -146,6 +216,39 @@ class TestRunContextOutcome:
         assert ctx.outcome.value_type == "tickets_resolved"
         assert ctx.outcome.value_amount == 1.0
 
+    def test_duration_ms_none_until_complete(self):
+        ctx = RunContext.create(workflow="test", event_id="evt-1", customer_id="cust-1")
+        assert ctx.duration_ms is None
+
+        time.sleep(0.005)
+        ctx.complete(status=RunStatus.SUCCESS)
+        assert ctx.duration_ms is not None
+        assert ctx.duration_ms >= 5.0
+
+    def test_elapsed_ms_uses_monotonic_clock(self):
+        clock = "botanu.models.run_context.time"
+        clocks = {"monotonic_ns": mock.Mock(return_value=1_000_000_000), "time_ns": mock.Mock(return_value=0)}
+        with mock.patch.multiple(clock, **clocks):
+            ctx = RunContext(
+                run_id="r", workflow="test", event_id="evt-1", customer_id="cust-1", environment="dev", start_time_ns=0
+            )
+        with mock.patch(f"{clock}.monotonic_ns", return_value=1_250_000_000):
+            assert ctx.elapsed_ms == 250.0
+
+    def test_duration_ms_measured_from_supplied_start_time(self):
+        start_ns = time.time_ns() - 2_000_000_000
+        ctx = RunContext(
+            run_id="r",
+            workflow="test",
+            event_id="evt-1",
+            customer_id="cust-1",
+            environment="dev",
+            start_time_ns=start_ns,
+        )
+        ctx.complete(status=RunStatus.SUCCESS)
+        assert 2000.0 <= ctx.duration_ms < 3000.0
+        assert ctx.to_span_attributes()["botanu.run.duration_ms"] >= 2000.0
+
 
 class TestRunContextSerialization:
     """Tests for baggage and span attribute serialization."""
@@ -197,6 +300,70 @@ class TestRunContextSerialization:
         assert attrs.get("botanu.outcome.value_type") == "tickets"
         assert attrs.get("botanu.outcome.value_amount") == 1.0
 
+    def test_optional_fields_omitted_when_unset(self):
+        ctx = RunContext.create(workflow="test", event_id="evt-1", customer_id="cust-1")
+        baggage = ctx.to_baggage_dict()
+        attrs = ctx.to_span_attributes()
+
+        for key in ("botanu.tenant_id", "botanu.parent_run_id", "botanu.retry_of_run_id"):
+            assert key not in baggage
+            assert key not in attrs
+        assert "botanu.workflow.version" not in attrs
+        assert "botanu.root_run_id" not in baggage
+        assert attrs["botanu.root_run_id"] == ctx.run_id
+
+    def test_retry_fields_serialized(self):
+        original = RunContext.create(workflow="test", event_id="evt-1", customer_id="cust-1")
+        retry = RunContext.create_retry(original)
+        baggage = retry.to_baggage_dict()
+        attrs = retry.to_span_attributes()
+
+        assert baggage["botanu.retry_of_run_id"] == original.run_id
+        assert baggage["botanu.root_run_id"] == original.run_id
+        assert baggage["botanu.attempt"] == "2"
+        assert attrs["botanu.retry_of_run_id"] == original.run_id
+        assert attrs["botanu.attempt"] == 2
+
+    def test_to_baggage_dict_cached_until_cancellation(self):
+        ctx = RunContext.create(workflow="test", event_id="evt-1", customer_id="cust-1")
+        first = ctx.to_baggage_dict()
+        first["botanu.workflow"] = "mutated"
+        assert ctx.to_baggage_dict()["botanu.workflow"] == "test"
+        assert "botanu.cancelled" not in ctx.to_baggage_dict()
+
+        ctx.request_cancellation()
+        assert ctx.to_baggage_dict()["botanu.cancelled"] == "true"
+
+    def test_request_cancellation_invalidates_both_caches(self):
+        ctx = RunContext.create(workflow="test", event_id="evt-1", customer_id="cust-1")
+        ctx.to_baggage_dict()
+        ctx.to_span_attributes()
+
+        ctx.request_cancellation()
+
+        assert ctx.to_baggage_dict()["botanu.cancelled"] == "true"
+        attrs = ctx.to_span_attributes()
+        assert attrs["botanu.run.cancelled"] is True
+        assert attrs["botanu.run.cancelled_at"] == ctx.cancelled_at
+
+    def test_to_span_attributes_returns_fresh_dict(self):
+        ctx = RunContext.create(workflow="test", event_id="evt-1", customer_id="cust-1")
+        first = ctx.to_span_attributes()
+        first["botanu.workflow"] = "mutated"
+        assert ctx.to_span_attributes()["botanu.workflow"] == "test"
+
+    def test_to_span_attributes_reflects_cancellation_and_outcome(self):
+        ctx = RunContext.create(workflow="test", event_id="evt-1", customer_id="cust-1")
+        assert "botanu.run.cancelled" not in ctx.to_span_attributes()
+
+        ctx.request_cancellation()
+        ctx.complete(status=RunStatus.FAILURE, error_class="TimeoutError")
+        attrs = ctx.to_span_attributes()
+
+        assert attrs["botanu.run.cancelled"] is True
+        assert attrs["botanu.outcome.error_class"] == "TimeoutError"
+        assert "botanu.run.duration_ms" in attrs
+
     def test_from_baggage_roundtrip(self):
         original = RunContext.create(
             workflow="test",
@@ -214,6 +381,35 @@ class TestRunContextSerialization:
         assert restored.customer_id == original.customer_id
         assert restored.tenant_id == original.tenant_id
 
+    def test_from_baggage_parses_retry_and_deadline(self):
+        restored = RunContext.from_baggage(
+            {
+                "botanu.run_id": "run-2",
+                "botanu.workflow": "test",
+                "botanu.attempt": "3",
+                "botanu.deadline": "1700000000500",
+                "botanu.cancelled": "true",
+            }
+        )
+        assert restored is not None
+        assert restored.attempt == 3
+        assert restored.deadline == 1700000000.5
+        assert restored.cancelled is True
+
+    def test_from_baggage_ignores_malformed_numbers(self):
+        restored = RunContext.from_baggage(
+            {
+                "botanu.run_id": "run-2",
+                "botanu.workflow": "test",
+                "botanu.attempt": "-2",
+                "botanu.deadline": "soon",
+            }
+        )
+        assert restored is not None
+        assert restored.attempt == 1
+        assert restored.deadline is None
+        assert restored.cancelled is False
+
     def test_from_baggage_returns_none_for_missing_fields(self):
         result = RunContext.from_baggage({})
         assert result is None
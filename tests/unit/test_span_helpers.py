@@ -5,6 +5,8 @@
 
 from __future__ import annotations
 
+from unittest.mock import MagicMock
+
 from opentelemetry import trace
 
 from botanu.sdk.span_helpers import emit_outcome, set_business_context, set_correlation
@@ -57,6 +59,29 @@ class TestEmitOutcome:
         assert "status" not in dict(events[0].attributes)
 
 
+class TestNonRecordingSpan:
+    """Helpers skip all span work when the current span is not recording."""
+
+    @staticmethod
+    def _non_recording_span():
+        span = MagicMock(spec=trace.Span)
+        span.is_recording.return_value = False
+        return span
+
+    def test_emit_outcome_skips_non_recording_span(self):
+        span = self._non_recording_span()
+        with trace.use_span(span):
+            emit_outcome(value_type="orders", value_amount=1, metadata={"k": "v"})
+        span.set_attribute.assert_not_called()
+        span.add_event.assert_not_called()
+
+    def test_set_business_context_skips_non_recording_span(self):
+        span = self._non_recording_span()
+        with trace.use_span(span):
+            set_business_context(customer_id="c", team="t")
+        span.set_attribute.assert_not_called()
+
+
 class TestSetBusinessContext:
     """Tests for set_business_context function."""
 